@@ -1,16 +1,86 @@
 #!/usr/bin/env python3
 """ Main module """
 
-import traceback
 import os
 import re
-from flask import Flask, render_template, request, redirect, url_for, session
+import time
+from flask import Flask, render_template, request, redirect, url_for, session, jsonify, g
 from src.trie import Trie
 from src.errors import SearchMiss
+from src.registry import DictionaryRegistry
+from src.overlay import TrieView
+from src.cache import ResultCache
+from src.api import handle as api_handle
+from src.session_store import MemoryStore, FileStore
+from src.sessions import ServerSideSessionInterface
+from src import metrics
 
 app = Flask(__name__)
 app.secret_key = re.sub(r"[^a-z\d]", "", os.path.realpath(__file__))
 
+# Session data stays on the server, in files shared by every process (app.cgi starts one
+# per request) unless SESSION_STORE=memory is set for a server running in one process
+if os.environ.get("SESSION_STORE") == "memory":
+    session_store = MemoryStore(ttl=int(os.environ.get("SESSION_TTL", 86400)))
+else:
+    session_store = FileStore(
+        os.environ.get("SESSION_DIR", os.path.join(app.instance_path, "sessions")),
+        ttl=int(os.environ.get("SESSION_TTL", 86400)),
+    )
+
+app.session_interface = ServerSideSessionInterface(session_store)
+
+# Tries shared by all requests, max size in bytes, storage engine ("node",
+# "compact" or "mapped") and word sets for membership can be set through the environment
+dictionaries = DictionaryRegistry(
+    max_bytes=int(os.environ.get("DICT_CACHE_BYTES", DictionaryRegistry.default_max_bytes)),
+    engine=os.environ.get("DICT_ENGINE", "node"),
+    word_set=bool(os.environ.get("DICT_WORD_SET")),
+)
+
+# Recent prefix search and spelling results, keyed by dictionary version and removed words
+results = ResultCache(
+    maxsize=int(os.environ.get("RESULT_CACHE_SIZE", 4096)),
+    ttl=float(os.environ["RESULT_CACHE_TTL"]) if os.environ.get("RESULT_CACHE_TTL") else None,
+)
+
+metrics.registry.register_collector(
+    "spellchecker_result_cache_total", "Result cache lookups and removals.", "counter",
+    lambda: {(("event", name),): value for name, value in results.stats().items()
+             if name != "size"})
+metrics.registry.register_collector(
+    "spellchecker_result_cache_entries", "Entries in the result cache.", "gauge",
+    lambda: {(): len(results)})
+metrics.registry.register_collector(
+    "spellchecker_dictionary_bytes", "Estimated size of loaded dictionaries.", "gauge",
+    lambda: {(): dictionaries.total_size()})
+
+# Words per page in list-words
+LIST_PAGE_SIZE = int(os.environ.get("LIST_PAGE_SIZE", 500))
+
+# The sampling profiler can be toggled through /metrics/profiler if this is set
+profiler_enabled = bool(os.environ.get("METRICS_PROFILER"))
+
+@app.before_request
+def start_timer():
+    """ Remember when the request started. """
+
+    g.start = time.perf_counter()
+
+@app.after_request
+def observe_request(response):
+    """ Record request duration per route. """
+
+    if "start" in g:
+        metrics.request_seconds.observe(time.perf_counter() - g.start, route=route_name())
+
+    return response
+
+def route_name():
+    """ Return route pattern of current request, used as metric label. """
+
+    return request.url_rule.rule if request.url_rule is not None else "unmatched"
+
 @app.route("/")
 def main():
     """ Main route. """
@@ -32,7 +102,7 @@ def init():
         session["message"] = ""
 
     if session.get("removed_words") is None:
-        session["removed_words"] = []
+        session["removed_words"] = set()
 
     if session.get("prefix_results") is None:
         session["prefix_results"] = []
@@ -68,8 +138,7 @@ def check_word_post():
     word = request.form.get("fword").lower()
 
     if word:
-        trie = Trie.create_from_file()
-        remove_words(trie)
+        trie = get_trie()
 
         try:
             trie.has_word(word)
@@ -82,16 +151,18 @@ def check_word_post():
 # List Words
 @app.route("/list-words")
 def list_words():
-    """ List all words in current dictionary. """
+    """ List words in current dictionary alphabetically, one page from ?start= on. """
     init()
 
-    trie = Trie.create_from_file()
-    remove_words(trie)
+    trie = get_trie()
+    start = request.args.get("start", "").lower()
 
-    word_list = trie.get_all_words()
-    word_list.sort()
+    # One word more than shown, it starts the next page
+    word_list = list(trie.iter_words(start, limit=LIST_PAGE_SIZE + 1))
+    next_start = word_list.pop() if len(word_list) > LIST_PAGE_SIZE else None
 
-    return render_template("list-words.html", word_list=word_list)
+    return render_template("list-words.html", word_list=word_list, start=start,
+                           next_start=next_start, num_words=trie.get_num_words())
 
 # Remove Word
 @app.route("/remove-word")
@@ -115,11 +186,12 @@ def remove_word_post():
         if word not in session["removed_words"]:
 
             # Check that the dictionary has the word
-            trie = Trie.create_from_file()
+            trie = dictionaries.get(session["curr_dict"])
 
             try:
                 trie.has_word(word)
-                session["removed_words"].append(word)
+                session["removed_words"].add(word)
+                session.modified = True
                 session["message"] = f"'{word}' was removed from dictionary."
             except SearchMiss:
                 session["message"] = f"'{word}' is not in dictionary."
@@ -157,14 +229,14 @@ def prefix_search_post():
     prefix = request.form.get("fpre").lower()
 
     if prefix:
-        trie = Trie.create_from_file()
-        remove_words(trie)
+        trie = get_trie()
 
-        for word in trie.prefix_search(prefix):
+        for word in results.call(trie, "prefix_search", prefix):
             session["prefix_results"].append(word)
 
         if len(session["prefix_results"]) > 0:
             session["prefix_results"].insert(0, prefix)
+            session.modified = True
         else:
             session["message"] = f"No results for '{prefix}'."
 
@@ -198,14 +270,14 @@ def correct_spelling_post():
     fword = request.form.get("fword").lower()
 
     if fword:
-        trie = Trie.create_from_file()
-        remove_words(trie)
+        trie = get_trie()
 
-        for word in trie.correct_spelling(fword):
+        for word in results.call(trie, "correct_spelling", fword):
             session["cs_results"].append(word)
 
         if len(session["cs_results"]) > 0:
             session["cs_results"].insert(0, fword)
+            session.modified = True
         else:
             session["message"] = f"No suggestions available for '{fword}'."
 
@@ -239,14 +311,14 @@ def suffix_search_post():
     suffix = request.form.get("fsuf").lower()
 
     if suffix:
-        trie = Trie.create_from_file()
-        remove_words(trie)
+        trie = get_trie()
 
         for word in trie.suffix_search(suffix):
             session["suffix_results"].append(word)
 
         if len(session["suffix_results"]) > 0:
             session["suffix_results"].insert(0, suffix)
+            session.modified = True
         else:
             session["message"] = f"No results for '{suffix}'."
 
@@ -285,7 +357,7 @@ def change_dict_post():
 
         session["curr_dict"] = app.static_folder + "/" + new_dct
 
-        session["removed_words"] = []
+        session["removed_words"] = set()
 
         session["message"] = f"Dictionary changed to '{new_dct}'"
 
@@ -304,11 +376,65 @@ def reset():
 
     return redirect(url_for('main'))
 
-def remove_words(trie):
-    """ Remove words stored in session from trie. """
+# JSON API
+@app.route("/api/<endpoint>", methods=["GET", "POST"])
+def api(endpoint):
+    """
+    Answer check, prefix, suffix, correct and batch queries (json).
+
+    Parameters are taken from the query string and a JSON body, batch also
+    accepts the text as a plain body. The session is read but never written.
+    """
+
+    params = request.args.to_dict()
+    data = request.get_json(force=True, silent=True) if request.data else None
+
+    # Like asgi.py, JSON that isn't an object is ignored, or taken as batch text
+    if isinstance(data, dict):
+        params.update(data)
+    elif endpoint == "batch" and "text" not in params and request.data:
+        params["text"] = request.get_data(as_text=True)
+
+    path = session.get("curr_dict", app.static_folder + "/frequency.txt")
+    trie = TrieView(dictionaries.get(path), session.get("removed_words"))
+
+    status, body = api_handle(trie, endpoint, params, results)
+
+    return jsonify(body), status
+
+# Metrics
+@app.route("/metrics")
+def show_metrics():
+    """ Timings, counters and cache statistics in Prometheus text format. """
+
+    return metrics.registry.render(), 200, {"Content-Type": "text/plain; version=0.0.4"}
+
+@app.route("/metrics/profiler", methods=["GET", "POST"])
+def profiler():
+    """
+    Sampling profiler, only available if METRICS_PROFILER is set.
+
+    GET returns the samples in collapsed stack format, POST with action
+    start, stop or clear controls it.
+    """
 
-    for removed_word in session["removed_words"]:
-        trie.remove_word(removed_word)
+    if not profiler_enabled:
+        return page_not_found(None), 404
+
+    if request.method == "POST":
+        action = request.values.get("action")
+
+        if action not in ("start", "stop", "clear"):
+            return "action must be start, stop or clear", 400
+
+        getattr(metrics.profiler, action)()
+
+    return metrics.profiler.report(), 200, {"Content-Type": "text/plain"}
+
+def get_trie():
+    """ Return view of current dictionary without words removed in session. """
+
+    return TrieView(dictionaries.get(session["curr_dict"]), session["removed_words"])
 
 @app.errorhandler(404)
 def page_not_found(e):
@@ -318,9 +444,13 @@ def page_not_found(e):
 
 @app.errorhandler(500)
 def internal_server_error(e):
-    """ * """
-    #pylint: disable=unused-argument
-    return traceback.format_exc()
+    """ Count and log the error, the traceback is not sent to the client. """
+
+    metrics.request_errors.inc(route=route_name())
+    app.logger.error("Error handling %s", request.path,
+                     exc_info=getattr(e, "original_exception", None) or e)
+
+    return "hej, 500 error", 500
 
 if __name__=="__main__":
     app.run(debug=True)
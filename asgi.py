@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+JSON API as an ASGI application, without sessions or templates.
+
+Run with any ASGI server, e.g. uvicorn asgi:app. The dictionary is taken from
+DICT_PATH and loaded once at startup, DICT_ENGINE selects the storage engine and
+DICT_WORD_SET adds a set of words for fast membership checks.
+"""
+
+import asyncio
+import json
+import os
+from urllib.parse import parse_qs
+from src.api import handle
+from src.cache import ResultCache
+from src.registry import DictionaryRegistry
+
+DICT_PATH = os.environ.get(
+    "DICT_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "static", "frequency.txt")
+)
+
+dictionaries = DictionaryRegistry(engine=os.environ.get("DICT_ENGINE", "node"),
+                                  word_set=bool(os.environ.get("DICT_WORD_SET")))
+results = ResultCache(maxsize=int(os.environ.get("RESULT_CACHE_SIZE", 4096)))
+
+# Endpoints slow enough to run in a thread instead of the event loop. A short prefix
+# walks a whole subtree and the first suffix search builds the reversed-word index.
+BLOCKING = {"correct", "batch", "prefix", "suffix"}
+
+async def app(scope, receive, send):
+    """ ASGI entry point. """
+
+    if scope["type"] == "lifespan":
+        await lifespan(receive, send)
+        return
+
+    if scope["type"] != "http":
+        return
+
+    path = scope["path"]
+
+    if not path.startswith("/api/"):
+        await send_json(send, 404, {"error": "Not found"})
+        return
+
+    endpoint = path[len("/api/"):]
+    query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+    params = {name: values[-1] for name, values in query.items()}
+
+    if scope["method"] == "POST":
+        body = await read_body(receive)
+
+        try:
+            data = json.loads(body)
+        except ValueError:
+            data = None
+
+        if isinstance(data, dict):
+            params.update(data)
+        elif endpoint == "batch" and "text" not in params:
+            params["text"] = body.decode("utf-8", errors="replace")
+
+    trie = dictionaries.get(DICT_PATH)
+
+    if endpoint in BLOCKING:
+        status, body = await asyncio.to_thread(handle, trie, endpoint, params, results)
+    else:
+        status, body = handle(trie, endpoint, params, results)
+
+    await send_json(send, status, body)
+
+async def lifespan(receive, send):
+    """ Load the dictionary before the server accepts requests. """
+
+    while True:
+        message = await receive()
+
+        if message["type"] == "lifespan.startup":
+            await asyncio.to_thread(dictionaries.get, DICT_PATH)
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+async def read_body(receive):
+    """ Return the whole request body. """
+
+    chunks = []
+
+    while True:
+        message = await receive()
+        chunks.append(message.get("body", b""))
+
+        if not message.get("more_body"):
+            return b"".join(chunks)
+
+async def send_json(send, status, body):
+    """ Send body as a JSON response. """
+
+    data = json.dumps(body).encode("utf-8")
+
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [(b"content-type", b"application/json"),
+                    (b"content-length", str(len(data)).encode())],
+    })
+    await send({"type": "http.response.body", "body": data})
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+""" Time parallel batch correction with 1..N worker processes. """
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, ".")
+
+# pylint: disable=wrong-import-position
+from src.trie import Trie
+from src.parallel import correct_many
+
+def main():
+    """ Print words per second for every number of workers up to the number of cores. """
+
+    trie = Trie.create_from_file()
+    rnd = random.Random(1)
+    words = [word[:-1] + "q" for word in rnd.sample(trie.get_all_words(), 400)]
+
+    start = time.perf_counter()
+    expected = [trie.correct_spelling(word) for word in words]
+    serial = time.perf_counter() - start
+    print(f"serial     {len(words) / serial:8.0f} words/s")
+
+    for workers in range(1, (os.cpu_count() or 1) + 1):
+        start = time.perf_counter()
+        results = correct_many(words, trie, workers=workers)
+        elapsed = time.perf_counter() - start
+
+        assert results == expected
+        print(f"workers={workers:<2} {len(words) / elapsed:8.0f} words/s "
+              f"speedup {serial / elapsed:4.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+""" Compare request latency of app.cgi, started per request, with the preforked server.py. """
+
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+QUERY = "word=hello"
+
+def percentiles(times):
+    """ Return p50 and max of times in milliseconds as text. """
+
+    times = sorted(times)
+
+    return f"p50 {times[len(times) // 2] * 1000:8.1f} ms  max {times[-1] * 1000:8.1f} ms"
+
+def time_cgi(requests):
+    """ Return durations of requests run through app.cgi, one process each. """
+
+    env = dict(os.environ, REQUEST_METHOD="GET", PATH_INFO="/api/check", QUERY_STRING=QUERY,
+               SERVER_NAME="localhost", SERVER_PORT="80", SERVER_PROTOCOL="HTTP/1.1")
+    times = []
+
+    for _ in range(requests):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "app.cgi"], cwd=ROOT, env=env, check=True,
+                       capture_output=True)
+        times.append(time.perf_counter() - start)
+
+    return times
+
+def time_server(requests, workers):
+    """ Return (startup, durations) of requests to a freshly started server.py. """
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    url = f"http://127.0.0.1:{port}/api/check?{QUERY}"
+    start = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, "server.py", "--port", str(port),
+                             "--workers", str(workers)], cwd=ROOT)
+
+    try:
+        while True:
+            try:
+                with urllib.request.urlopen(url, timeout=10) as response:
+                    response.read()
+                break
+            except OSError:
+                time.sleep(0.01)
+
+        startup = time.perf_counter() - start
+        times = []
+
+        for _ in range(requests):
+            start = time.perf_counter()
+
+            with urllib.request.urlopen(url, timeout=10) as response:
+                response.read()
+
+            times.append(time.perf_counter() - start)
+    finally:
+        proc.terminate()
+        proc.wait()
+
+    return startup, times
+
+def main():
+    """ Print latency of both paths. """
+
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    workers = os.cpu_count() or 1
+
+    print(f"cgi              {percentiles(time_cgi(requests))}")
+
+    startup, times = time_server(requests * 10, workers)
+    print(f"server startup   {startup * 1000:8.1f} ms, {workers} workers")
+    print(f"server requests  {percentiles(times)}")
+
+if __name__ == "__main__":
+    main()
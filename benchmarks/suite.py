@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for trie operations across dictionary sizes.
+
+Measures construction time, peak memory during construction and per-call
+latency percentiles for the main trie operations, on the bundled
+dictionaries and on synthetic ones of the given sizes. Results are written
+as JSON so runs from different commits can be compared:
+
+    python3 benchmarks/suite.py --output new.json
+    python3 benchmarks/suite.py --sizes 1000000 --output big.json
+    python3 benchmarks/suite.py --compare old.json new.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+# pylint: disable=wrong-import-position
+from src.registry import engines
+from src.errors import SearchMiss
+
+DICTIONARIES = [os.path.join(ROOT, "static", name)
+                for name in ["tiny_frequency.txt", "frequency.txt"]]
+LETTERS = "etaoinshrdlcumwfgypbvkjxqz"
+
+def synthetic_dictionary(path, num_words, seed=1):
+    """ Write num_words random words with Zipf distributed frequencies to path. """
+
+    rnd = random.Random(seed)
+    # Common letters are picked more often, like in English
+    weights = [1 / (rank + 1.5) for rank in range(len(LETTERS))]
+    words = set()
+
+    while len(words) < num_words:
+        length = max(2, min(16, int(rnd.gauss(8, 2.5))))
+        words.add("".join(rnd.choices(LETTERS, weights, k=length)))
+
+    with open(path, mode="w", encoding="utf-8") as fd:
+        for rank, word in enumerate(sorted(words, key=lambda _: rnd.random()), start=1):
+            fd.write(f"{word} {1e7 / rank:.1f}\n")
+
+def misspell(rnd, word):
+    """ Return word with one random substitution, deletion or insertion. """
+
+    index = rnd.randrange(len(word))
+    edit = rnd.randrange(3)
+
+    if edit == 0:
+        return word[:index] + rnd.choice(LETTERS) + word[index + 1:]
+    if edit == 1 and len(word) > 1:
+        return word[:index] + word[index + 1:]
+
+    return word[:index] + rnd.choice(LETTERS) + word[index:]
+
+def percentile(values, fraction):
+    """ Return value at fraction of the sorted values. """
+
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+def time_calls(func, args_list):
+    """ Return latency statistics in microseconds of func over args_list. """
+
+    times = []
+
+    for args in args_list:
+        start = time.perf_counter_ns()
+
+        try:
+            func(*args)
+        except SearchMiss:
+            pass
+
+        times.append((time.perf_counter_ns() - start) / 1000)
+
+    times.sort()
+
+    return {
+        "n": len(times),
+        "mean_us": round(sum(times) / len(times), 2),
+        "p50_us": round(percentile(times, 0.50), 2),
+        "p90_us": round(percentile(times, 0.90), 2),
+        "p99_us": round(percentile(times, 0.99), 2),
+        "max_us": round(times[-1], 2),
+    }
+
+def bench_dictionary(path, engine, queries, measure_memory):
+    """ Return benchmark results for one dictionary file and engine. """
+
+    factory = engines[engine]
+
+    start = time.perf_counter()
+    trie = factory(path)
+    build = time.perf_counter() - start
+
+    peak = None
+
+    if measure_memory:
+        tracemalloc.start()
+        factory(path)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    words = trie.get_all_words()
+    rnd = random.Random(2)
+    sample = [rnd.choice(words) for _ in range(queries)]
+    few = sample[:max(1, queries // 10)]
+
+    ops = {
+        "has_word": time_calls(trie.has_word, [(word,) for word in sample]),
+        "has_word_miss": time_calls(trie.has_word, [(misspell(rnd, word),) for word in sample]),
+        "prefix_search": time_calls(trie.prefix_search, [(word[:2],) for word in sample]),
+        "suffix_search": time_calls(trie.suffix_search, [(word[-3:],) for word in sample]),
+        "correct_spelling": time_calls(trie.correct_spelling,
+                                       [(misspell(rnd, word),) for word in few]),
+        "get_all_words": time_calls(trie.get_all_words, [()] * 3),
+    }
+
+    # Mutates the trie, so it runs last
+    if hasattr(trie, "remove_word"):
+        ops["remove_word"] = time_calls(trie.remove_word, [(word,) for word in set(sample)])
+
+    return {
+        "dictionary": os.path.basename(path),
+        "words": len(words),
+        "engine": engine,
+        "build_s": round(build, 4),
+        "peak_memory_bytes": peak,
+        "ops": ops,
+    }
+
+def git_commit():
+    """ Return current commit hash, or None outside a git checkout. """
+
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                              check=True, cwd=ROOT).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run(args):
+    """ Run all benchmarks and return the report. """
+
+    results = []
+    tmp_dir = tempfile.mkdtemp()
+
+    try:
+        paths = [] if args.no_bundled else list(DICTIONARIES)
+
+        for size in args.sizes:
+            path = os.path.join(tmp_dir, f"synthetic_{size}.txt")
+            synthetic_dictionary(path, size)
+            paths.append(path)
+
+        for path in paths:
+            for engine in args.engines:
+                result = bench_dictionary(path, engine, args.queries, not args.no_memory)
+                results.append(result)
+                print(f"{result['dictionary']:24} {engine:8} build {result['build_s']:8.3f} s "
+                      f"has_word p50 {result['ops']['has_word']['p50_us']:8.2f} us",
+                      file=sys.stderr)
+    finally:
+        shutil.rmtree(tmp_dir)
+
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+def compare(old, new, threshold):
+    """ Print p50 changes between two reports, return True if any got slower than threshold. """
+
+    old_results = {(res["dictionary"], res["engine"]): res for res in old["results"]}
+    regressed = False
+
+    for res in new["results"]:
+        base = old_results.get((res["dictionary"], res["engine"]))
+
+        if base is None:
+            continue
+
+        metrics = [("build", base["build_s"], res["build_s"])]
+        metrics += [(op, base["ops"][op]["p50_us"], stats["p50_us"])
+                    for op, stats in res["ops"].items() if op in base["ops"]]
+
+        for name, before, after in metrics:
+            ratio = after / before if before else 1.0
+            flag = ""
+
+            if ratio > 1 + threshold:
+                flag = "  SLOWER"
+                regressed = True
+            elif ratio < 1 - threshold:
+                flag = "  faster"
+
+            print(f"{res['dictionary']:24} {res['engine']:8} {name:18} "
+                  f"{before:12.2f} -> {after:12.2f}  x{ratio:5.2f}{flag}")
+
+    return regressed
+
+def main():
+    """ Parse arguments and run or compare benchmarks. """
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--engines", nargs="+", default=["node"], choices=sorted(engines))
+    parser.add_argument("--sizes", nargs="*", type=int, default=[10000, 100000],
+                        help="synthetic dictionary sizes (default: %(default)s)")
+    parser.add_argument("--queries", type=int, default=500,
+                        help="calls per operation (default: %(default)s)")
+    parser.add_argument("--no-bundled", action="store_true",
+                        help="skip the dictionaries in static/")
+    parser.add_argument("--no-memory", action="store_true",
+                        help="skip the second, traced build measuring peak memory")
+    parser.add_argument("--output", help="write JSON report to file instead of stdout")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"),
+                        help="compare two JSON reports and exit 1 on regressions")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="relative change reported by --compare (default: %(default)s)")
+    args = parser.parse_args()
+
+    if args.compare:
+        reports = []
+
+        for path in args.compare:
+            with open(path, encoding="utf-8") as fd:
+                reports.append(json.load(fd))
+
+        return 1 if compare(*reports, args.threshold) else 0
+
+    report = json.dumps(run(args), indent=2)
+
+    if args.output:
+        with open(args.output, mode="w", encoding="utf-8") as fd:
+            fd.write(report + "\n")
+    else:
+        print(report)
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+""" Spell check text files or stdin from the command line. """
+
+import argparse
+import sys
+from src.document import check_stream
+from src.registry import engines
+
+def main():
+    """ Parse arguments and print one line per misspelled word. """
+
+    parser = argparse.ArgumentParser(description="Spell check text files or stdin.")
+    parser.add_argument("files", nargs="*", help="files to check, stdin if none")
+    parser.add_argument("-d", "--dict", default="static/frequency.txt",
+                        help="dictionary file (default: %(default)s)")
+    parser.add_argument("-e", "--engine", default="node", choices=sorted(engines),
+                        help="trie storage engine (default: %(default)s)")
+    parser.add_argument("-s", "--suggestions", type=int, default=0,
+                        help="number of suggestions per word (default: %(default)s)")
+    parser.add_argument("--chunk-size", type=int, default=65536,
+                        help="characters read at a time (default: %(default)s)")
+    args = parser.parse_args()
+
+    trie = engines[args.engine](args.dict)
+    found = False
+
+    for path in args.files or ["-"]:
+        if path == "-":
+            fd = sys.stdin
+        else:
+            fd = open(path, mode="r", encoding="utf-8", errors="replace")  # pylint: disable=consider-using-with
+
+        with fd:
+            for line, column, word, suggs in check_stream(trie, fd, args.chunk_size,
+                                                          args.suggestions):
+                found = True
+                hint = f" -> {', '.join(suggs)}" if suggs else ""
+                print(f"{path}:{line}:{column}: {word}{hint}")
+
+    return 1 if found else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# pylint: disable=import-outside-toplevel
+"""
+Preforked server for the website, replacing the per-request CGI startup.
+
+The master process imports the app, loads the dictionaries once, freezes
+them out of the garbage collector's reach and forks the workers, so every
+worker shares the tries' memory pages copy-on-write and answers its first
+request as fast as any other. Workers serve the shared listening socket with
+wsgiref and are replaced if they die. SIGTERM or SIGINT stops them all.
+
+    python3 server.py --port 8000 --workers 4
+
+Sessions are kept in files that all workers share. Metrics are per worker.
+"""
+
+import argparse
+import gc
+import os
+import signal
+import sys
+from wsgiref.simple_server import WSGIServer, WSGIRequestHandler
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+DICTIONARIES = [os.path.join(ROOT, "static", name)
+                for name in ["tiny_frequency.txt", "frequency.txt"]]
+
+class RequestHandler(WSGIRequestHandler):
+    """ Request handler that only logs if access_log is set. """
+
+    access_log = False
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """ Log to stderr if enabled. """
+
+        if self.access_log:
+            super().log_message(format, *args)
+
+class PreforkServer():
+    """
+    Master process forking workers that serve one WSGI app on a shared socket.
+
+    preload is called in the master before forking, to load everything the
+    workers should share.
+    """
+
+    def __init__(self, app, host="127.0.0.1", port=8000, workers=None, preload=None):
+        """ Constructor, binds the socket. """
+
+        self.app = app
+        self.workers = workers or os.cpu_count() or 1
+        self.preload = preload
+        self.server = WSGIServer((host, port), RequestHandler)
+        self.server.set_app(app)
+        self.children = set()
+        self.stopping = False
+
+    @property
+    def address(self):
+        """ Return (host, port) the server listens on. """
+
+        return self.server.server_address
+
+    def run(self):
+        """ Preload, fork workers and replace them until stopped. """
+
+        # Objects made while loading would otherwise be touched by every collection in
+        # every worker, copying the pages they live on
+        gc.disable()
+
+        if self.preload is not None:
+            self.preload()
+
+        gc.freeze()
+
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+
+        for _ in range(self.workers):
+            self._fork()
+
+        while self.children:
+            try:
+                pid, _ = os.wait()
+            except ChildProcessError:
+                break
+
+            self.children.discard(pid)
+
+            if not self.stopping:
+                self._fork()
+
+        self.server.server_close()
+
+    def _fork(self):
+        """ Start one worker. """
+
+        pid = os.fork()
+
+        if pid:
+            self.children.add(pid)
+            return
+
+        # Worker
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        gc.enable()
+        status = 0
+
+        try:
+            self.server.serve_forever()
+        except BaseException:  # pylint: disable=broad-except
+            status = 1
+        finally:
+            os._exit(status)  # pylint: disable=protected-access
+
+    def _stop(self, *_):
+        """ Signal handler stopping all workers. """
+
+        self.stopping = True
+
+        for pid in list(self.children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                self.children.discard(pid)
+
+def main():
+    """ Parse arguments, preload dictionaries and serve the website. """
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="worker processes (default: %(default)s)")
+    parser.add_argument("--preload", nargs="*", default=DICTIONARIES,
+                        help="dictionaries loaded before forking (default: the ones in static/)")
+    parser.add_argument("--access-log", action="store_true", help="log every request")
+    args = parser.parse_args()
+
+    RequestHandler.access_log = args.access_log
+
+    from app import app, dictionaries
+
+    def preload():
+        for path in args.preload:
+            dictionaries.get(path)
+
+    server = PreforkServer(app, args.host, args.port, args.workers, preload)
+    host, port = server.address
+    print(f"Serving on http://{host}:{port} with {server.workers} workers", file=sys.stderr)
+    server.run()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+""" Module for the JSON API shared by the Flask and ASGI apps. """
+
+from src.errors import InvalidRequest
+
+def _word(params, name):
+    """ Return required lowercased string parameter. """
+
+    value = params.get(name)
+
+    if not isinstance(value, str) or not value:
+        raise InvalidRequest(f"Missing parameter '{name}'")
+
+    return value.lower()
+
+def _int(params, name, default):
+    """ Return optional non-negative integer parameter. """
+
+    try:
+        value = int(params.get(name, default))
+    except (TypeError, ValueError) as e:
+        raise InvalidRequest(f"Parameter '{name}' must be an integer") from e
+
+    if value < 0:
+        raise InvalidRequest(f"Parameter '{name}' must not be negative")
+
+    return value
+
+def _call(cache, trie, method, *args, **options):
+    """ Call trie method through cache if there is one. """
+
+    if cache is None:
+        return getattr(trie, method)(*args, **options)
+
+    return cache.call(trie, method, *args, **options)
+
+def check(trie, params, _):
+    """ Check if dictionary has a word. """
+
+    word = _word(params, "word")
+
+    return {"word": word, "found": trie.contains(word)}
+
+def prefix(trie, params, cache):
+    """ Most frequent words starting with prefix. """
+
+    pre = _word(params, "prefix")
+    matches = _call(cache, trie, "prefix_search", pre, _int(params, "k", 10))
+
+    return {"prefix": pre, "results": [{"word": word, "freq": freq} for word, freq in matches]}
+
+def suffix(trie, params, cache):
+    """ Most frequent words ending with suffix. """
+
+    suf = _word(params, "suffix")
+    matches = _call(cache, trie, "suffix_search", suf, _int(params, "limit", 10))
+
+    return {"suffix": suf, "results": matches}
+
+def correct(trie, params, cache):
+    """ Spelling suggestions for a word. """
+
+    word = _word(params, "word")
+    transpositions = str(params.get("transpositions", True)).lower() not in ("0", "false", "no")
+    suggs = _call(cache, trie, "correct_spelling", word,
+                  max_distance=min(_int(params, "max_distance", 2), 3),
+                  transpositions=transpositions,
+                  limit=_int(params, "limit", 10))
+
+    return {"word": word, "suggestions": suggs}
+
+def batch(trie, params, _):
+    """ Misspelled words of a whole text. """
+
+    text = params.get("text")
+
+    if not isinstance(text, str):
+        raise InvalidRequest("Missing parameter 'text'")
+
+    return {"misspelled": trie.check_text(text, _int(params, "suggestions", 5))}
+
+endpoints = {
+    "check": check,
+    "prefix": prefix,
+    "suffix": suffix,
+    "correct": correct,
+    "batch": batch,
+}
+
+def handle(trie, endpoint, params, cache=None):
+    """ Return (status, body) for an API request. """
+
+    func = endpoints.get(endpoint)
+
+    if func is None:
+        return 404, {"error": f"Unknown endpoint '{endpoint}'"}
+
+    try:
+        return 200, func(trie, params, cache)
+    except InvalidRequest as e:
+        return 400, {"error": str(e)}
@@ -0,0 +1,110 @@
+""" Module for LRU result caching. """
+
+import itertools
+import threading
+import time
+from collections import OrderedDict
+
+# Unique ids for tries, unlike id() never reused within a process
+next_uid = itertools.count().__next__
+
+class LRUCache():
+    """
+    Thread safe mapping that keeps the maxsize most recently used entries.
+
+    Entries older than ttl seconds are dropped on access if ttl is set.
+    Counts hits, misses, evictions and expirations.
+    """
+
+    def __init__(self, maxsize=4096, ttl=None):
+        """ Constructor. """
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+        # key -> (expires, value)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """ Return cached value for key, or default. """
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None and entry[0] is not None and entry[0] < time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+            return entry[1]
+
+    def put(self, key, value):
+        """ Store value for key, evicting the least recently used entry if full. """
+
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+
+        with self._lock:
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """ Drop all entries. """
+
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """ Return dict with counters and current size. """
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "size": len(self._entries),
+        }
+
+    def __len__(self):
+        """ Return number of cached entries. """
+
+        return len(self._entries)
+
+class ResultCache(LRUCache):
+    """
+    LRU cache in front of trie lookups.
+
+    Keys combine the trie's cache_key() (identity and version, which changes
+    when words are added or removed, or a view's removal set changes), the
+    method name and its arguments. Cached results are shared, callers must not
+    modify them.
+    """
+
+    _missing = object()
+
+    def call(self, trie, method, *args, **options):
+        """ Return trie.method(*args, **options), cached. """
+
+        key = (trie.cache_key(), method, args, tuple(sorted(options.items())))
+        result = self.get(key, self._missing)
+
+        if result is self._missing:
+            result = getattr(trie, method)(*args, **options)
+            self.put(key, result)
+
+        return result
@@ -0,0 +1,482 @@
+""" Module for CompactTrie class. """
+
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import islice
+
+from src.errors import SearchMiss
+from src.distance import first_row, next_row
+from src.document import check_text
+from src.cache import next_uid
+from src.metrics import timed, nodes_visited
+
+# Compiled file layout: header followed by the freqs, labels, first and count arrays
+MAGIC = b"SPCTRIE\0"
+VERSION = 1
+HEADER = struct.Struct("<8sHHIQQQQ")
+
+class CompactTrie():
+    """
+    Read-only trie stored in flat arrays instead of Node objects.
+
+    Nodes are numbered in breadth-first order with node 0 as root, so the
+    children of a node are stored next to each other, sorted by letter:
+
+    * labels[i] is the code point of the letter node i represents
+    * first[i] is the index of the first child of node i
+    * count[i] is the number of children of node i
+    * freqs[i] is the frequency of the word ending at node i, or -1 if none
+
+    The arrays can be compiled to a binary file with save() and memory-mapped
+    back with load(), so opening a dictionary doesn't parse any text and the
+    pages are shared between all processes that map the same file.
+    """
+
+    compiled_suffix = ".trie"
+
+    default_dict = "static/frequency.txt"
+
+    def __init__(self, word_list=None):
+        """ Constructor. """
+
+        pairs = {}
+
+        for item in word_list or []:
+            word, freq = item.split()
+            pairs[word] = float(freq)
+
+        self._build(sorted(pairs.items()))
+
+    @classmethod
+    def create_from_file(cls, path=None):
+        """ Create new trie object populated with words from file. """
+
+        if path is None:
+            path = cls.default_dict
+
+        with open(file=path, mode="r", encoding="utf-8") as fd:
+
+            word_list = [line.rstrip("\n") for line in fd.readlines()]
+
+        return cls(word_list)
+
+    @classmethod
+    def open(cls, path=None):
+        """
+        Return trie for text dictionary at path using its compiled form.
+
+        The compiled file is rebuilt when missing or older than the text file.
+        """
+
+        if path is None:
+            path = cls.default_dict
+
+        compiled = path + cls.compiled_suffix
+        stat = os.stat(path)
+        source = (stat.st_mtime_ns, stat.st_size)
+
+        try:
+            return cls.load(compiled, source)
+        except (OSError, ValueError):
+            pass
+
+        trie = cls.create_from_file(path)
+
+        try:
+            trie.save(compiled, source)
+        except OSError:
+            # Directory not writable, use the in-memory trie
+            return trie
+
+        return cls.load(compiled, source)
+
+    def save(self, path, source=(0, 0)):
+        """ Write arrays to binary file, source is (mtime_ns, size) of text file. """
+
+        header = HEADER.pack(MAGIC, VERSION, sys.byteorder == "little", 0,
+                             len(self.freqs), self.num_words, *source)
+
+        # Write to temporary file and rename, so readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".")
+
+        try:
+            with os.fdopen(fd, "wb") as out:
+                out.write(header)
+
+                for arr in (self.freqs, self.labels, self.first, self.count):
+                    out.write(arr)
+
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    @classmethod
+    def load(cls, path, source=None):
+        """
+        Memory-map trie from binary file written by save().
+
+        Raises ValueError if the file is not a compatible compiled trie, or if
+        source is given and doesn't match the text file the trie was built from.
+        """
+
+        with open(path, "rb") as fd:
+            mapped = mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, version, little, _, num_nodes, num_words, *stamp = \
+                HEADER.unpack_from(mapped)
+        except struct.error as e:
+            mapped.close()
+            raise ValueError("Truncated compiled trie") from e
+
+        size = HEADER.size + num_nodes * (8 + 4 + 4 + 4)
+
+        if (magic != MAGIC or version != VERSION or len(mapped) != size
+                or bool(little) != (sys.byteorder == "little")
+                or (source is not None and tuple(stamp) != tuple(source))):
+            mapped.close()
+            raise ValueError("Incompatible or stale compiled trie")
+
+        trie = cls.__new__(cls)
+        trie.num_words = num_words
+        trie.suffix_index = None
+        trie.word_set = None
+        trie.uid = next_uid()
+        trie._mmap = mapped  # pylint: disable=protected-access,attribute-defined-outside-init
+
+        view = memoryview(mapped)
+        offset = HEADER.size
+
+        for name, code in (("freqs", "d"), ("labels", "I"), ("first", "I"), ("count", "I")):
+            end = offset + num_nodes * struct.calcsize(code)
+            setattr(trie, name, view[offset:end].cast(code))
+            offset = end
+
+        return trie
+
+    @classmethod
+    def from_trie(cls, trie):
+        """ Create compact copy of a node based trie. """
+
+        compact = cls()
+        pairs = []
+
+        if trie.root is not None:
+            # pylint: disable=protected-access
+            pairs = [(word, node.freq) for word, node in trie._iter_words(trie.root)]
+
+        compact._build(sorted(pairs))
+
+        return compact
+
+    def _build(self, pairs):
+        """ Fill arrays from sorted (word, freq) pairs. """
+
+        self.labels = array("I")
+        self.first = array("I")
+        self.count = array("I")
+        self.freqs = array("d")
+        self.num_words = len(pairs)
+        self.suffix_index = None
+        self.word_set = None
+        self.uid = next_uid()
+
+        # Every queued node covers the range of words sharing its prefix
+        self.labels.append(0)
+        queue = [(0, len(pairs), 0)]
+        head = 0
+
+        while head < len(queue):
+            low, high, depth = queue[head]
+            head += 1
+
+            freq = -1.0
+
+            # Sorted input puts the word equal to the prefix first
+            if low < high and len(pairs[low][0]) == depth:
+                freq = pairs[low][1]
+                low += 1
+
+            self.freqs.append(freq)
+            self.first.append(len(queue))
+
+            while low < high:
+                letter = pairs[low][0][depth]
+                end = low + 1
+
+                while end < high and pairs[end][0][depth] == letter:
+                    end += 1
+
+                self.labels.append(ord(letter))
+                queue.append((low, end, depth + 1))
+                low = end
+
+            self.count.append(len(queue) - self.first[-1])
+
+    def cache_key(self):
+        """ Return key identifying the contents of trie, which never change. """
+
+        return (self.uid, 0)
+
+    @property
+    def nbytes(self):
+        """ Return number of bytes held by the arrays. """
+
+        return sum(len(arr) * arr.itemsize
+                   for arr in (self.labels, self.first, self.count, self.freqs))
+
+    def _child(self, node, letter):
+        """ Return index of child with letter, or -1 if missing. """
+
+        low = self.first[node]
+        high = low + self.count[node]
+        code = ord(letter)
+
+        index = bisect_left(self.labels, code, low, high)
+
+        if index < high and self.labels[index] == code:
+            return index
+
+        return -1
+
+    def _find(self, prefix):
+        """ Return index of node reached by prefix, or -1 if missing. """
+
+        node = 0
+
+        for letter in prefix:
+            node = self._child(node, letter)
+
+            if node < 0:
+                break
+
+        return node
+
+    def _walk(self, node, prefix, stack=None):
+        """
+        Yield (word, freq) for all words below node, alphabetically.
+
+        If given, stack holds more (node, word) pairs to continue with, the
+        last one first.
+        """
+
+        labels, first, count, freqs = self.labels, self.first, self.count, self.freqs
+        stack = stack or []
+        stack.append((node, prefix))
+
+        while stack:
+            node, word = stack.pop()
+
+            if freqs[node] >= 0:
+                yield word, freqs[node]
+
+            start = first[node]
+
+            for child in range(start + count[node] - 1, start - 1, -1):
+                stack.append((child, word + chr(labels[child])))
+
+    @timed("has_word")
+    def has_word(self, word, exclude=None):
+        """ Check if trie contains word, words in exclude count as missing. """
+
+        if not self.contains(word, exclude):
+            raise SearchMiss
+
+        return True
+
+    def contains(self, word, exclude=None):
+        """ Return True if trie contains word, like has_word but without raising. """
+
+        if exclude and word in exclude:
+            return False
+
+        if self.word_set is not None:
+            return word in self.word_set
+
+        node = self._find(word)
+
+        return node >= 0 and self.freqs[node] >= 0
+
+    @timed("contains_many")
+    def contains_many(self, words, exclude=None):
+        """ Return list of booleans telling which words trie contains. """
+
+        if self.word_set is not None:
+            word_set = self.word_set
+
+            return [word in word_set and not (exclude and word in exclude) for word in words]
+
+        contains = self.contains
+
+        return [contains(word, exclude) for word in words]
+
+    def enable_word_set(self):
+        """ Keep a set of all words, answering membership without walking the trie. """
+
+        self.word_set = frozenset(word for word, _ in self._walk(0, ""))
+
+    @timed("get_num_words")
+    def get_num_words(self):
+        """ Return number of words in trie. """
+
+        return self.num_words
+
+    @timed("get_all_words")
+    def get_all_words(self, exclude=None):
+        """ Return a list with all words in trie, alphabetically. """
+
+        return [word for word, _ in self._walk(0, "")
+                if not (exclude and word in exclude)]
+
+    def iter_words(self, start="", offset=0, limit=None, exclude=None):
+        """ Return lazy iterator over words in alphabetical order, see Trie.iter_words. """
+
+        stop = None if limit is None else offset + limit
+        words = (word for word, _ in self._seek(start)
+                 if not (exclude and word in exclude))
+
+        return islice(words, offset, stop)
+
+    def _seek(self, start):
+        """ Yield (word, freq) for words from start on, alphabetically. """
+
+        labels, first, count = self.labels, self.first, self.count
+        node = 0
+        stack = []
+
+        # Seek along start, keeping the children after it at each level
+        for depth, letter in enumerate(start):
+            low, high = first[node], first[node] + count[node]
+            after = bisect_right(labels, ord(letter), low, high)
+            stack.extend((child, start[:depth] + chr(labels[child]))
+                         for child in range(high - 1, after - 1, -1))
+            node = self._child(node, letter)
+
+            if node < 0:
+                break
+        else:
+            yield from self._walk(node, start, stack)
+            return
+
+        if stack:
+            node, word = stack.pop()
+            yield from self._walk(node, word, stack)
+
+    @timed("prefix_search")
+    def prefix_search(self, prefix, k=10, exclude=None):
+        """ Return the k most frequent words starting with prefix. """
+
+        node = self._find(prefix)
+
+        # Like Trie.prefix_search, the empty prefix matches nothing
+        if node <= 0:
+            return []
+
+        word_list = [item for item in self._walk(node, prefix)
+                     if not (exclude and item[0] in exclude)]
+
+        word_list.sort(key=lambda item: (-item[1], item[0]))
+
+        return word_list[:k]
+
+    @timed("correct_spelling")
+    def correct_spelling(self, input_word, max_distance=2, transpositions=True, limit=10,
+                         exclude=None):
+        """ Return up to limit words within max_distance edits, see Trie.correct_spelling. """
+
+        try:
+            self.has_word(input_word, exclude)
+            return [input_word]
+        except SearchMiss:
+            pass
+
+        labels, first, count, freqs = self.labels, self.first, self.count, self.freqs
+        suggs = []
+        buf = []
+        stack = [(child, 0, first_row(input_word), None, None)
+                 for child in range(first[0], first[0] + count[0])]
+        push = stack.append
+        visited = 0
+
+        while stack:
+            node, depth, prev_row, prev_prev_row, prev_letter = stack.pop()
+            key = chr(labels[node])
+            visited += 1
+
+            del buf[depth:]
+            buf.append(key)
+
+            row = next_row(input_word, prev_row, key,
+                           prev_prev_row if transpositions else None, prev_letter)
+
+            if freqs[node] >= 0 and row[-1] <= max_distance:
+                word = "".join(buf)
+
+                if not (exclude and word in exclude):
+                    suggs.append((word, row[-1], freqs[node]))
+
+            # A transposition can still lower the next row by one edit
+            if min(row) > max_distance and not (transpositions and min(prev_row) < max_distance):
+                continue
+
+            depth += 1
+            start = first[node]
+
+            for child in range(start, start + count[node]):
+                push((child, depth, row, prev_row, key))
+
+        nodes_visited.inc(visited, traversal="correct_spelling")
+        suggs.sort(key=lambda sugg: (sugg[1], -sugg[2], sugg[0]))
+
+        return [word for word, _, _ in suggs[:limit]]
+
+    @timed("check_text")
+    def check_text(self, text, suggestions=5, **options):
+        """ Return misspelled words in text with offsets and suggestions, see check_text. """
+
+        return check_text(self, text, suggestions, **options)
+
+    @timed("suffix_search")
+    def suffix_search(self, suffix, limit=None, exclude=None):
+        """
+        Return words ending with suffix, most frequent first.
+
+        Looked up as a prefix in a compact trie of reversed words, built on
+        first use.
+        """
+
+        if not suffix:
+            return []
+
+        # pylint: disable=protected-access
+        if self.suffix_index is None:
+            index = CompactTrie()
+            index._build(sorted((word[::-1], freq) for word, freq in self._walk(0, "")))
+            self.suffix_index = index
+
+        reverse = suffix[::-1]
+        node = self.suffix_index._find(reverse)
+
+        if node < 0:
+            return []
+
+        items = [(word[::-1], freq) for word, freq in self.suffix_index._walk(node, reverse)]
+
+        if exclude:
+            items = [item for item in items if item[0] not in exclude]
+
+        items.sort(key=lambda item: (-item[1], item[0]))
+
+        return [word for word, _ in items[:limit]]
+
+if __name__ == "__main__":
+    # Compile text dictionaries given as arguments
+    for dict_path in sys.argv[1:] or [CompactTrie.default_dict]:
+        CompactTrie.open(dict_path)
@@ -0,0 +1,54 @@
+""" Module for edit distance helpers. """
+
+def first_row(word):
+    """ Return edit distance row for the empty string against word. """
+
+    return list(range(len(word) + 1))
+
+def next_row(word, prev_row, letter, prev_prev_row=None, prev_letter=None):
+    """
+    Return edit distance row after appending letter to the current string.
+
+    prev_row holds the distances from the current string to every prefix of
+    word. If prev_prev_row and prev_letter (the row and letter one step back)
+    are given, swapping two adjacent letters counts as one edit, which gives
+    the optimal string alignment variant of Damerau-Levenshtein distance.
+    """
+
+    row = [prev_row[0] + 1]
+
+    for j in range(1, len(word) + 1):
+        value = min(prev_row[j] + 1, row[j - 1] + 1, prev_row[j - 1] + (word[j - 1] != letter))
+
+        if (prev_prev_row is not None and j > 1 and word[j - 1] == prev_letter
+                and word[j - 2] == letter and prev_prev_row[j - 2] + 1 < value):
+            value = prev_prev_row[j - 2] + 1
+
+        row.append(value)
+
+    return row
+
+def distance(first, second, transpositions=True, max_distance=None):
+    """
+    Return edit distance between two words.
+
+    With max_distance, gives up as soon as the distance is known to exceed
+    it and returns max_distance + 1.
+    """
+
+    prev_prev_row = None
+    prev_row = first_row(second)
+    prev_letter = None
+
+    for letter in first:
+        row = next_row(second, prev_row, letter,
+                       prev_prev_row if transpositions else None, prev_letter)
+
+        # A transposition can only lower the next row to prev_row + 1
+        if (max_distance is not None and min(row) > max_distance
+                and not (transpositions and min(prev_row) < max_distance)):
+            return max_distance + 1
+
+        prev_prev_row, prev_row, prev_letter = prev_row, row, letter
+
+    return prev_row[-1]
@@ -0,0 +1,111 @@
+""" Module for checking whole texts against a trie. """
+
+import re
+
+# A word is a run of letters, digits and punctuation separate words
+WORD_RE = re.compile(r"[^\W\d_]+")
+
+def tokenize(text):
+    """ Yield (word, start, end) for every word in text, words are lowercased. """
+
+    for match in WORD_RE.finditer(text):
+        yield match.group().lower(), match.start(), match.end()
+
+def check_text(trie, text, suggestions=5, **options):
+    """
+    Return misspelled words in text.
+
+    Each unique word is looked up once. The result has one dict per
+    misspelled word, in order of first appearance, with the word, the
+    (start, end) offsets of all its occurrences and up to suggestions
+    corrections. Other options are passed on to trie.correct_spelling.
+    """
+
+    offsets = {}
+
+    for word, start, end in tokenize(text):
+        offsets.setdefault(word, []).append((start, end))
+
+    misspelled = []
+
+    words = list(offsets)
+
+    for word, found in zip(words, trie.contains_many(words)):
+        if not found:
+            misspelled.append({
+                "word": word,
+                "offsets": offsets[word],
+                "suggestions": trie.correct_spelling(word, limit=suggestions, **options)
+                               if suggestions else [],
+            })
+
+    return misspelled
+
+def check_stream(trie, fd, chunk_size=65536, suggestions=0, cache_size=100000, **options):
+    """
+    Yield (line, column, word, suggestions) for every misspelled word read from fd.
+
+    The text is read in chunks of chunk_size characters, so memory use doesn't
+    grow with the size of the input. A word cut by a chunk boundary is carried
+    over to the next chunk. Lines and columns start at 1. Results for up to
+    cache_size unique words are remembered between occurrences.
+    """
+
+    known = {}
+    line, column = 1, 1
+    carry = ""
+
+    while True:
+        chunk = fd.read(chunk_size)
+        buf = carry + chunk
+        pos = 0
+        cut = len(buf)
+
+        for match in WORD_RE.finditer(buf):
+            start = match.start()
+
+            # The word may continue in the next chunk
+            if chunk and match.end() == len(buf):
+                cut = start
+                break
+
+            line, column = _advance(buf, pos, start, line, column)
+            pos = start
+
+            word = match.group().lower()
+
+            if word not in known:
+                if len(known) >= cache_size:
+                    known.clear()
+
+                known[word] = _check_word(trie, word, suggestions, options)
+
+            if known[word] is not None:
+                yield line, column, word, known[word]
+
+        if not chunk:
+            return
+
+        line, column = _advance(buf, pos, cut, line, column)
+        carry = buf[cut:]
+
+def _advance(buf, start, end, line, column):
+    """ Return line and column of buf[end] given those of buf[start]. """
+
+    newlines = buf.count("\n", start, end)
+
+    if newlines:
+        return line + newlines, end - buf.rfind("\n", start, end)
+
+    return line, column + end - start
+
+def _check_word(trie, word, suggestions, options):
+    """ Return None if word is in trie, else list of suggestions. """
+
+    if trie.contains(word):
+        return None
+
+    if not suggestions:
+        return []
+
+    return trie.correct_spelling(word, limit=suggestions, **options)
@@ -5,3 +5,6 @@ class Error(Exception):
 
 class SearchMiss(Error):
     """ Raised if search results empty. """
+
+class InvalidRequest(Error):
+    """ Raised if API parameters are missing or invalid. """
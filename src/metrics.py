@@ -0,0 +1,319 @@
+""" Module for timing metrics in Prometheus text format and a sampling profiler. """
+
+import os
+import sys
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter as Tally
+from functools import wraps
+
+def _labels(names, values):
+    """ Return Prometheus label string like {a="1",b="2"}. """
+
+    if not names:
+        return ""
+
+    pairs = ",".join(f'{name}="{value}"' for name, value in zip(names, values))
+
+    return "{" + pairs + "}"
+
+class Counter():
+    """ Monotonic counter with optional labels. """
+
+    kind = "counter"
+
+    def __init__(self, name, doc, labels=()):
+        """ Constructor. """
+
+        self.name = name
+        self.doc = doc
+        self.label_names = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        """ Add amount to the counter for labels. """
+
+        key = tuple(labels[name] for name in self.label_names)
+
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        """ Return current value for labels. """
+
+        return self._values.get(tuple(labels[name] for name in self.label_names), 0)
+
+    def samples(self):
+        """ Yield (suffix, label string, value) for every label combination. """
+
+        for key, value in sorted(self._values.items()):
+            yield "", _labels(self.label_names, key), value
+
+class Histogram():
+    """ Histogram of observed values with cumulative buckets, like Prometheus. """
+
+    kind = "histogram"
+
+    default_buckets = (0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005,
+                       0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+    def __init__(self, name, doc, labels=(), buckets=None):
+        """ Constructor. """
+
+        self.name = name
+        self.doc = doc
+        self.label_names = tuple(labels)
+        self.buckets = tuple(buckets or self.default_buckets)
+
+        # labels -> [bucket counts..., count, sum]
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        """ Record one value for labels. """
+
+        self.labels(**labels)(value)
+
+    def labels(self, **labels):
+        """ Return function recording one value for labels, cheaper than observe in hot paths. """
+
+        key = tuple(labels[name] for name in self.label_names)
+
+        with self._lock:
+            counts = self._values.get(key)
+
+            if counts is None:
+                counts = self._values[key] = [0] * (len(self.buckets) + 2)
+
+        buckets = self.buckets
+        num_buckets = len(buckets)
+        lock = self._lock
+
+        def observe(value):
+            index = bisect_left(buckets, value)
+
+            with lock:
+                if index < num_buckets:
+                    counts[index] += 1
+
+                counts[-2] += 1
+                counts[-1] += value
+
+        return observe
+
+    def count(self, **labels):
+        """ Return number of observations for labels. """
+
+        counts = self._values.get(tuple(labels[name] for name in self.label_names))
+
+        return counts[-2] if counts else 0
+
+    def time(self, **labels):
+        """ Return context manager observing the duration of its block. """
+
+        return _Timer(self, labels)
+
+    def samples(self):
+        """ Yield (suffix, label string, value) for every label combination. """
+
+        names = self.label_names + ("le",)
+
+        for key, counts in sorted(self._values.items()):
+            total = 0
+
+            for bound, count in zip(self.buckets, counts):
+                total += count
+                yield "_bucket", _labels(names, key + (bound,)), total
+
+            yield "_bucket", _labels(names, key + ("+Inf",)), counts[-2]
+            yield "_count", _labels(self.label_names, key), counts[-2]
+            yield "_sum", _labels(self.label_names, key), counts[-1]
+
+class _Timer():
+    """ Context manager observing elapsed seconds in a histogram. """
+
+    def __init__(self, histogram, labels):
+        """ Constructor. """
+
+        self.histogram = histogram
+        self.labels = labels
+        self.start = None
+
+    def __enter__(self):
+        """ Start timing. """
+
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        """ Stop timing. """
+
+        self.histogram.observe(time.perf_counter() - self.start, **self.labels)
+
+class MetricsRegistry():
+    """ Collection of metrics rendered together in Prometheus text format. """
+
+    def __init__(self):
+        """ Constructor. """
+
+        self.metrics = []
+        self.collectors = []
+
+    def counter(self, name, doc, labels=()):
+        """ Create and register a counter. """
+
+        metric = Counter(name, doc, labels)
+        self.metrics.append(metric)
+
+        return metric
+
+    def histogram(self, name, doc, labels=(), buckets=None):
+        """ Create and register a histogram. """
+
+        metric = Histogram(name, doc, labels, buckets)
+        self.metrics.append(metric)
+
+        return metric
+
+    def register_collector(self, name, doc, kind, func):
+        """ Add a metric whose {labels tuple: value} dict is read from func() when rendered. """
+
+        self.collectors.append((name, doc, kind, func))
+
+    def render(self):
+        """ Return all metrics in Prometheus text format. """
+
+        lines = []
+
+        for metric in self.metrics:
+            lines.append(f"# HELP {metric.name} {metric.doc}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+
+            for suffix, labels, value in metric.samples():
+                lines.append(f"{metric.name}{suffix}{labels} {value}")
+
+        for name, doc, kind, func in self.collectors:
+            lines.append(f"# HELP {name} {doc}")
+            lines.append(f"# TYPE {name} {kind}")
+
+            for labels, value in func().items():
+                lines.append(f"{name}{_labels(*zip(*labels)) if labels else ''} {value}")
+
+        return "\n".join(lines) + "\n"
+
+# Metrics shared by the whole process
+registry = MetricsRegistry()
+
+request_seconds = registry.histogram(
+    "spellchecker_request_seconds", "Time spent handling requests.", ["route"])
+request_errors = registry.counter(
+    "spellchecker_request_errors_total", "Requests that failed with an exception.", ["route"])
+method_seconds = registry.histogram(
+    "spellchecker_trie_method_seconds", "Time spent in trie methods.", ["method"])
+nodes_visited = registry.counter(
+    "spellchecker_nodes_visited_total", "Trie nodes visited by traversals.", ["traversal"])
+load_seconds = registry.histogram(
+    "spellchecker_dictionary_load_seconds", "Time spent loading dictionaries.", ["dictionary"],
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0))
+
+# Timing trie methods costs about 1.8 µs per call, METRICS_METHODS=0 turns it off
+method_timing = os.environ.get("METRICS_METHODS", "1") != "0"
+
+def timed(method):
+    """
+    Decorator recording the duration of calls to a trie method.
+
+    Leaves the method unwrapped if method_timing is off when it is decorated.
+    """
+
+    observe = method_seconds.labels(method=method)
+    clock = time.perf_counter
+
+    def decorator(func):
+        if not method_timing:
+            return func
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start = clock()
+
+            try:
+                return func(*args, **kwargs)
+            finally:
+                observe(clock() - start)
+
+        return wrapper
+
+    return decorator
+
+class SamplingProfiler():
+    """
+    Profiler sampling the stacks of all other threads every interval seconds.
+
+    Samples are counted per stack and reported in the collapsed format read
+    by flame graph tools, one "frame;frame;frame count" line per stack.
+    """
+
+    def __init__(self, interval=0.005):
+        """ Constructor. """
+
+        self.interval = interval
+        self.samples = Tally()
+        self._thread = None
+        self._stop = threading.Event()
+
+    @property
+    def running(self):
+        """ Check if the profiler is sampling. """
+
+        return self._thread is not None
+
+    def start(self):
+        """ Start sampling in a background thread. """
+
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="sampling-profiler",
+                                            daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """ Stop sampling, collected samples are kept. """
+
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    def clear(self):
+        """ Drop collected samples. """
+
+        self.samples.clear()
+
+    def _run(self):
+        """ Sample until stopped. """
+
+        own = threading.get_ident()
+
+        while not self._stop.wait(self.interval):
+            for ident, frame in sys._current_frames().items():  # pylint: disable=protected-access
+                if ident == own:
+                    continue
+
+                stack = []
+
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_filename}:{code.co_name}:{frame.f_lineno}")
+                    frame = frame.f_back
+
+                self.samples[";".join(reversed(stack))] += 1
+
+    def report(self):
+        """ Return collected samples in collapsed stack format. """
+
+        return "".join(f"{stack} {count}\n" for stack, count in self.samples.most_common())
+
+profiler = SamplingProfiler()
@@ -1,16 +1,49 @@
 # Which char does node represent?
-# list/dict for pointers to child nodes
+# dict for pointers to child nodes, shared and read-only until the first child is added
 # true/false is node stop node (word)?
 
 """ Module for Node class. """
 
+from types import MappingProxyType
+
 class Node():
-    """ Node class. """
+    """
+    Node class.
+
+    Uses slots instead of a __dict__ per node. Leaves, most of the nodes,
+    share one read-only empty mapping as children, so a node needs a dict
+    of its own only when a child is added, see add_child.
+    """
+
+    __slots__ = ("key", "children", "is_stop", "freq", "top", "best")
+
+    # Children of every node without any
+    empty = MappingProxyType({})
 
     def __init__(self, key=None):
         """ Constructor. """
 
         self.key = key
-        self.children = {}
+        self.children = Node.empty
         self.is_stop = False
+
+        # Frequency as a float, None unless stop node
         self.freq = None
+
+        # Cached most frequent (word, freq) pairs below node, None until computed
+        self.top = None
+
+        # Highest frequency at or below node, None until computed
+        self.best = None
+
+    def add_child(self, letter):
+        """ Add and return a new child node for letter. """
+
+        child = Node(letter)
+
+        if self.children is Node.empty:
+            self.children = {letter: child}
+        else:
+            self.children[letter] = child
+
+        return child
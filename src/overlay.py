@@ -0,0 +1,100 @@
+""" Module for TrieView class. """
+
+from src.document import check_text
+
+class TrieView():
+    """
+    Per-session view of a shared trie.
+
+    Removed words are kept in a private set and filtered out at lookup time,
+    so the shared trie is never mutated and many views can use the same one.
+    """
+
+    def __init__(self, trie, removed=None):
+        """ Constructor. """
+
+        self.trie = trie
+        self.removed = set(removed) if removed else set()
+        self._removed_key = None
+
+    def remove_word(self, word):
+        """ Hide a word from this view. """
+
+        # Raises SearchMiss if word isn't in trie or already removed
+        self.has_word(word)
+
+        self.removed.add(word)
+        self._removed_key = None
+
+    def cache_key(self):
+        """ Return key identifying the trie's contents and the removed words. """
+
+        if self._removed_key is None:
+            self._removed_key = frozenset(self.removed)
+
+        return (self.trie.cache_key(), self._removed_key)
+
+    def has_word(self, word):
+        """ Check if view contains word. """
+
+        return self.trie.has_word(word, exclude=self.removed)
+
+    def contains(self, word):
+        """ Return True if view contains word, without raising. """
+
+        return self.trie.contains(word, exclude=self.removed)
+
+    def contains_many(self, words):
+        """ Return list of booleans telling which words view contains. """
+
+        return self.trie.contains_many(words, exclude=self.removed)
+
+    def get_num_words(self):
+        """ Return number of words in view. """
+
+        contains = self.trie.contains
+        hidden = sum(1 for word in self.removed if contains(word))
+
+        return self.trie.get_num_words() - hidden
+
+    def get_all_words(self):
+        """ Return a list with all words in view. """
+
+        return self.trie.get_all_words(exclude=self.removed)
+
+    def iter_words(self, start="", offset=0, limit=None):
+        """ Return lazy iterator over words in view alphabetically, see Trie.iter_words. """
+
+        return self.trie.iter_words(start, offset, limit, exclude=self.removed)
+
+    def prefix_search(self, prefix, k=10):
+        """ Return the k most frequent words starting with prefix. """
+
+        return self.trie.prefix_search(prefix, k, exclude=self.removed)
+
+    def correct_spelling(self, input_word, **options):
+        """ Give word suggestions based on input, see Trie.correct_spelling. """
+
+        return self.trie.correct_spelling(input_word, exclude=self.removed, **options)
+
+    def query_session(self, **options):
+        """
+        Return QuerySession for text typed one letter at a time, see Trie.query_session.
+
+        Only the node engine supports it, raises TypeError for other tries.
+        """
+
+        if not hasattr(self.trie, "query_session"):
+            raise TypeError(f"{type(self.trie).__name__} has no query sessions, use Trie")
+
+        return self.trie.query_session(exclude=self.removed, **options)
+
+    def check_text(self, text, suggestions=5, **options):
+        """ Return misspelled words in text with offsets and suggestions. """
+
+        return check_text(self, text, suggestions, **options)
+
+    def suffix_search(self, suffix, limit=None):
+        """ Return words ending with suffix, most frequent first. """
+
+        return self.trie.suffix_search(suffix, limit, exclude=self.removed)
@@ -0,0 +1,91 @@
+""" Module for spell checking many words or texts in parallel processes. """
+
+import gc
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from src.registry import engines
+
+# Trie used in a worker process, set by _init_worker
+_trie = None
+
+def _init_worker(trie, path, engine):
+    """ Use the trie inherited on fork, or load the dictionary from path. """
+
+    global _trie  # pylint: disable=global-statement
+
+    _trie = trie if trie is not None else engines[engine](path)
+
+def _run_chunk(method, items, options):
+    """ Call a trie method for every item in a chunk. """
+
+    func = getattr(_trie, method)
+
+    return [func(item, **options) for item in items]
+
+def _run(method, items, trie, path, engine, workers, chunk_size, options):
+    """ Fan items out to worker processes and return results in input order. """
+
+    items = list(items)
+    chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+    frozen = False
+
+    if "fork" in multiprocessing.get_all_start_methods() and trie is not None:
+        # Forked workers get the trie without pickling it, freezing keeps the gc
+        # from touching its pages
+        context = multiprocessing.get_context("fork")
+
+        # Objects frozen before, like a server.py worker's, must stay frozen afterwards
+        if not gc.get_freeze_count():
+            gc.freeze()
+            frozen = True
+    else:
+        # Workers load the dictionary themselves, the mapped engine shares its pages
+        if path is None:
+            raise ValueError("A path is needed where workers can't fork")
+
+        context = multiprocessing.get_context("spawn")
+        trie = None
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                 initializer=_init_worker,
+                                 initargs=(trie, path, engine)) as executor:
+            results = executor.map(_run_chunk, [method] * len(chunks), chunks,
+                                   [options] * len(chunks))
+
+            return [result for chunk in results for result in chunk]
+    finally:
+        if frozen:
+            gc.unfreeze()
+
+def correct_many(words, trie=None, path=None, engine="mapped", workers=None, chunk_size=64,
+                 **options):
+    """
+    Return correct_spelling(word, **options) for every word, in input order.
+
+    On platforms that can fork, workers share trie (or the one loaded from
+    path) with the parent process. Otherwise each worker opens path with the
+    given engine, which for "mapped" shares one memory-mapped file, so path
+    is needed even if trie is given.
+    """
+
+    if trie is None and path is None:
+        raise ValueError("Either trie or path is needed")
+
+    if trie is None and "fork" in multiprocessing.get_all_start_methods():
+        trie = engines[engine](path)
+
+    return _run("correct_spelling", words, trie, path, engine, workers, chunk_size, options)
+
+def check_many(texts, trie=None, path=None, engine="mapped", workers=None, chunk_size=1,
+               **options):
+    """ Return check_text(text, **options) for every text, in input order, see correct_many. """
+
+    if trie is None and path is None:
+        raise ValueError("Either trie or path is needed")
+
+    if trie is None and "fork" in multiprocessing.get_all_start_methods():
+        trie = engines[engine](path)
+
+    return _run("check_text", texts, trie, path, engine, workers, chunk_size, options)
@@ -0,0 +1,177 @@
+""" Module for QuerySession class. """
+
+import heapq
+
+class QuerySession():
+    """
+    Prefix search and spelling correction for text typed one letter at a time.
+
+    For every typed prefix the session keeps the trie node it reaches and the
+    active nodes: every node whose word is within max_distance edits of the
+    typed text, with its distance. Typing a letter computes the next active
+    nodes from the current ones only, and backspace pops back to the previous
+    ones, so a keystroke costs the same however long the text is. Distances
+    are the same as Trie.correct_spelling's.
+
+    The state is rebuilt from the typed text if the trie changes.
+    """
+
+    def __init__(self, trie, max_distance=2, transpositions=True, exclude=None):
+        """ Constructor. """
+
+        self.trie = trie
+        self.max_distance = max_distance
+        self.transpositions = transpositions
+        self.exclude = exclude
+        self.text = ""
+        self._reset()
+
+    def _reset(self):
+        """ Start over from the root for the empty text. """
+
+        self.version = self.trie.version
+        root = self.trie.root
+        self._nodes = [root]
+
+        # Every node is (node, word, distance), a node in reach of the empty
+        # text by inserting up to max_distance letters
+        active = []
+
+        if root is not None:
+            active = list(self._insertions({root: (root, "", 0)}).values())
+
+        self._active = [active]
+
+    def _insertions(self, active):
+        """ Add nodes reached from active ones by letters missing from the text. """
+
+        for dist in range(self.max_distance):
+            for node, word, node_dist in [item for item in active.values() if item[2] == dist]:
+                for key, child in node.children.items():
+                    item = active.get(child)
+
+                    if item is None or item[2] > node_dist + 1:
+                        active[child] = (child, word + key, node_dist + 1)
+
+        return active
+
+    def _check_version(self):
+        """ Replay the typed text if the trie changed since the state was computed. """
+
+        if self.version != self.trie.version:
+            text = self.text
+            self.text = ""
+            self._reset()
+
+            for letter in text:
+                self.push(letter)
+
+    def push(self, letter):
+        """ Append a letter to the typed text. """
+
+        self._check_version()
+
+        max_distance = self.max_distance
+        active = {}
+
+        def relax(node, word, dist):
+            item = active.get(node)
+
+            if item is None or item[2] > dist:
+                active[node] = (node, word, dist)
+
+        for node, word, dist in self._active[-1]:
+            # The typed letter is one too many
+            if dist < max_distance:
+                relax(node, word, dist + 1)
+
+            # The typed letter matches or replaces the node's next letter
+            for key, child in node.children.items():
+                cost = dist if key == letter else dist + 1
+
+                if cost <= max_distance:
+                    relax(child, word + key, cost)
+
+        # The last two typed letters are swapped in the word
+        if self.transpositions and self.text and self.text[-1] != letter:
+            for node, word, dist in self._active[-2]:
+                if dist < max_distance:
+                    child = node.children.get(letter)
+                    grandchild = child.children.get(self.text[-1]) if child else None
+
+                    if grandchild is not None:
+                        relax(grandchild, word + letter + self.text[-1], dist + 1)
+
+        node = self._nodes[-1]
+        self._nodes.append(node.children.get(letter) if node is not None else None)
+        self._active.append(list(self._insertions(active).values()))
+        self.text += letter
+
+    def pop(self):
+        """ Remove the last typed letter, return it. """
+
+        if not self.text:
+            raise IndexError("Nothing to remove")
+
+        letter = self.text[-1]
+        self.text = self.text[:-1]
+        self._nodes.pop()
+        self._active.pop()
+        self._check_version()
+
+        return letter
+
+    def completions(self, k=10):
+        """ Return the k most frequent (word, freq) pairs starting with the typed text. """
+
+        self._check_version()
+        node = self._nodes[-1]
+
+        if node is None or not self.text:
+            return []
+
+        # pylint: disable=protected-access
+        return self.trie._node_top(node, self.text, k, self.exclude)
+
+    def suggestions(self, k=10):
+        """
+        Return the k best completions of words within max_distance of the typed text.
+
+        Ranked by distance of the prefix, then frequency, as (word, distance).
+        Exact completions come first.
+        """
+
+        self._check_version()
+        found = {}
+
+        for dist in range(self.max_distance + 1):
+            for node, word, node_dist in self._active[-1]:
+                if node_dist != dist or node is self.trie.root:
+                    continue
+
+                # pylint: disable=protected-access
+                for completion, freq in self.trie._node_top(node, word, k, self.exclude):
+                    if completion not in found:
+                        found[completion] = (dist, -freq, completion)
+
+            # Words from nodes further away can't rank higher
+            if len(found) >= k:
+                break
+
+        return [(word, dist) for dist, _, word in sorted(found.values())[:k]]
+
+    def corrections(self, k=10):
+        """
+        Return the k nearest words within max_distance of the typed text.
+
+        Ranked like Trie.correct_spelling, but a typed word that is in the
+        trie comes first instead of alone.
+        """
+
+        self._check_version()
+        exclude = self.exclude
+
+        items = ((dist, -node.freq, word) for node, word, dist in self._active[-1]
+                 if node.is_stop and not (exclude and word in exclude))
+
+        return [word for _, _, word in heapq.nsmallest(k, items)]
@@ -0,0 +1,169 @@
+""" Module for DictionaryRegistry class. """
+
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+from src.trie import Trie
+from src.compact import CompactTrie
+from src.metrics import load_seconds
+
+# Factories for the storage engines selectable by name
+engines = {
+    "node": Trie.create_from_file,
+    "compact": CompactTrie.create_from_file,
+    "mapped": CompactTrie.open,
+}
+
+def estimate_size(trie):
+    """ Estimate the number of bytes held by a trie. """
+
+    total = 0
+    word_set = getattr(trie, "word_set", None)
+
+    if word_set:
+        total += sys.getsizeof(word_set) + sum(sys.getsizeof(word) for word in word_set)
+
+    nbytes = getattr(trie, "nbytes", None)
+
+    if nbytes is not None:
+        return total + nbytes
+
+    if trie.root is None:
+        return total + sys.getsizeof(trie)
+
+    stack = [trie.root]
+
+    while stack:
+        node = stack.pop()
+        total += sys.getsizeof(node)
+
+        if node.children:
+            total += sys.getsizeof(node.children)
+
+        if hasattr(node, "__dict__"):
+            total += sys.getsizeof(node.__dict__)
+
+        stack.extend(node.children.values())
+
+    return total
+
+class DictionaryRegistry():
+    """
+    Process-wide cache of tries keyed by dictionary path.
+
+    Every trie is built once and shared read-only between requests and threads.
+    An entry is rebuilt when the file's mtime or size changes, and the least
+    recently used entries are evicted once the total estimated size exceeds
+    max_bytes. The most recently requested dictionary is never evicted.
+
+    Tries are built by factory(path), which defaults to the factory
+    registered for engine. If word_set is set, every trie keeps a set of its
+    words for fast membership checks, see Trie.enable_word_set.
+    """
+
+    default_max_bytes = 512 * 1024 * 1024
+
+    def __init__(self, max_bytes=None, factory=None, engine="node", word_set=False):
+        """ Constructor. """
+
+        self.max_bytes = self.default_max_bytes if max_bytes is None else max_bytes
+        self.factory = factory or engines[engine]
+        self.word_set = word_set
+
+        # path -> (stamp, trie, size), ordered from least to most recently used
+        self._entries = OrderedDict()
+        self._path_locks = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _stamp(path):
+        """ Return the (mtime, size) pair identifying a file version. """
+
+        stat = os.stat(path)
+
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def get(self, path):
+        """ Return the trie for path, building it if missing or stale. """
+
+        path = os.path.realpath(path)
+        stamp = self._stamp(path)
+
+        trie = self._lookup(path, stamp)
+
+        if trie is not None:
+            return trie
+
+        with self._path_lock(path):
+            # Another thread may have built it while we waited
+            trie = self._lookup(path, stamp)
+
+            if trie is not None:
+                return trie
+
+            with load_seconds.time(dictionary=os.path.basename(path)):
+                trie = self.factory(path)
+
+                if self.word_set:
+                    trie.enable_word_set()
+
+            size = estimate_size(trie)
+
+            with self._lock:
+                self._entries[path] = (stamp, trie, size)
+                self._entries.move_to_end(path)
+                self._evict()
+
+        return trie
+
+    def _lookup(self, path, stamp):
+        """ Return cached trie if present and fresh, else None. """
+
+        with self._lock:
+            entry = self._entries.get(path)
+
+            if entry is None or entry[0] != stamp:
+                return None
+
+            self._entries.move_to_end(path)
+
+            return entry[1]
+
+    def _path_lock(self, path):
+        """ Return the lock serializing builds of a single path. """
+
+        with self._lock:
+            return self._path_locks.setdefault(path, threading.Lock())
+
+    def _evict(self):
+        """ Drop least recently used entries until under max_bytes. """
+
+        while len(self._entries) > 1 and self.total_size() > self.max_bytes:
+            path, _ = self._entries.popitem(last=False)
+            self._path_locks.pop(path, None)
+
+    def total_size(self):
+        """ Return the estimated size of all cached tries. """
+
+        return sum(entry[2] for entry in self._entries.values())
+
+    def invalidate(self, path=None):
+        """ Drop one cached dictionary, or all of them if path is None. """
+
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(os.path.realpath(path), None)
+
+    def __contains__(self, path):
+        """ Check if a dictionary is currently cached. """
+
+        return os.path.realpath(path) in self._entries
+
+    def __len__(self):
+        """ Return number of cached dictionaries. """
+
+        return len(self._entries)
@@ -0,0 +1,179 @@
+""" Module for server-side session stores. """
+
+import copy
+import os
+import json
+import stat
+import re
+import tempfile
+import threading
+import time
+
+# Session ids are generated by secrets.token_urlsafe
+SID_RE = re.compile(r"[\w-]{16,128}")
+
+class MemoryStore():
+    """
+    Sessions kept in a dict in this process, dropped after ttl seconds without use.
+
+    Data is copied in and out, so requests never share the lists and sets in it.
+    Only for servers running in a single process.
+    """
+
+    def __init__(self, ttl=86400):
+        """ Constructor. """
+
+        self.ttl = ttl
+
+        # sid -> (expires, data)
+        self._sessions = {}
+        self._lock = threading.Lock()
+        self._next_purge = time.monotonic() + ttl
+
+    def get(self, sid):
+        """ Return session data for sid, or None if missing or expired. """
+
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._sessions.get(sid)
+
+            if entry is None or entry[0] < now:
+                self._sessions.pop(sid, None)
+                return None
+
+            data = entry[1]
+
+        return copy.deepcopy(data)
+
+    def set(self, sid, data):
+        """ Store session data for sid and restart its expiry. """
+
+        now = time.monotonic()
+        data = copy.deepcopy(data)
+
+        with self._lock:
+            self._sessions[sid] = (now + self.ttl, data)
+
+            # Expired sessions that are never asked for again are purged now and then
+            if now > self._next_purge:
+                self._sessions = {key: entry for key, entry in self._sessions.items()
+                                  if entry[0] >= now}
+                self._next_purge = now + self.ttl
+
+    def delete(self, sid):
+        """ Drop session sid. """
+
+        with self._lock:
+            self._sessions.pop(sid, None)
+
+    def __len__(self):
+        """ Return number of stored sessions. """
+
+        return len(self._sessions)
+
+class FileStore():
+    """
+    Sessions saved as JSON to one file each in directory, expired by modification time.
+
+    Sets are saved as sorted lists, the ones under set_keys become sets again
+    when loaded. The directory is created private to this user, and one that
+    others own or can write to is refused, since they could plant sessions.
+    """
+
+    set_keys = ("removed_words",)
+
+    def __init__(self, directory, ttl=86400):
+        """ Constructor, raises PermissionError if directory isn't private. """
+
+        self.directory = directory
+        self.ttl = ttl
+        self._next_purge = time.time() + ttl
+
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        info = os.stat(directory)
+
+        if info.st_uid != os.getuid() or stat.S_IMODE(info.st_mode) & 0o022:
+            raise PermissionError(
+                f"Session directory {directory} must be owned by this user and not writable "
+                "by group or others")
+
+    def _path(self, sid):
+        """ Return file path for sid, or None if sid isn't well formed. """
+
+        if not SID_RE.fullmatch(sid):
+            return None
+
+        return os.path.join(self.directory, sid)
+
+    def get(self, sid):
+        """ Return session data for sid, or None if missing or expired. """
+
+        path = self._path(sid)
+
+        if path is None:
+            return None
+
+        try:
+            if os.path.getmtime(path) + self.ttl < time.time():
+                os.unlink(path)
+                return None
+
+            with open(path, "r", encoding="utf-8") as fd:
+                data = json.load(fd)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(data, dict):
+            return None
+
+        for key in self.set_keys:
+            if isinstance(data.get(key), list):
+                data[key] = set(data[key])
+
+        return data
+
+    def set(self, sid, data):
+        """ Store session data for sid and restart its expiry. """
+
+        path = self._path(sid)
+
+        if path is None:
+            raise ValueError("Malformed session id")
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory)
+
+        with os.fdopen(fd, "w", encoding="utf-8") as out:
+            json.dump(data, out, default=sorted)
+
+        os.replace(tmp_path, path)
+
+        # Expired sessions that are never asked for again are purged now and then
+        if time.time() > self._next_purge:
+            self.purge()
+
+    def purge(self):
+        """ Delete files of expired sessions. """
+
+        now = time.time()
+        self._next_purge = now + self.ttl
+
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+
+            try:
+                if SID_RE.fullmatch(name) and os.path.getmtime(path) + self.ttl < now:
+                    os.unlink(path)
+            except OSError:
+                pass
+
+    def delete(self, sid):
+        """ Drop session sid. """
+
+        path = self._path(sid)
+
+        if path is not None:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,75 @@
+""" Module for Flask sessions stored on the server. """
+
+import secrets
+
+from flask.sessions import SessionInterface, SessionMixin
+from werkzeug.datastructures import CallbackDict
+
+class ServerSideSession(CallbackDict, SessionMixin):
+    """ Session data kept in a store, the cookie only holds sid. """
+
+    def __init__(self, initial=None, sid=None, new=False):
+        """ Constructor. """
+
+        def on_update(session):
+            session.modified = True
+
+        CallbackDict.__init__(self, initial, on_update)
+        self.sid = sid
+        self.new = new
+        self.modified = False
+
+class ServerSideSessionInterface(SessionInterface):
+    """
+    Session interface saving sessions in a MemoryStore or FileStore.
+
+    Unknown session ids get a new random id, so clients can't pick their own.
+    """
+
+    def __init__(self, store):
+        """ Constructor. """
+
+        self.store = store
+
+    def open_session(self, app, request):
+        """ Load session for the id in the request's cookie. """
+
+        sid = request.cookies.get(self.get_cookie_name(app))
+
+        if sid:
+            data = self.store.get(sid)
+
+            if data is not None:
+                return ServerSideSession(data, sid=sid)
+
+        return ServerSideSession(sid=secrets.token_urlsafe(32), new=True)
+
+    def save_session(self, app, session, response):
+        """ Store session and send its id. """
+
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+
+        if not session:
+            if not session.new:
+                self.store.delete(session.sid)
+                response.delete_cookie(name, domain=domain, path=path)
+
+            return
+
+        # Handlers changing lists and sets in place set session.modified themselves
+        if session.modified:
+            self.store.set(session.sid, dict(session))
+
+        if session.new or self.should_set_cookie(app, session):
+            response.set_cookie(
+                name,
+                session.sid,
+                expires=self.get_expiration_time(app, session),
+                httponly=self.get_cookie_httponly(app),
+                domain=domain,
+                path=path,
+                secure=self.get_cookie_secure(app),
+                samesite=self.get_cookie_samesite(app),
+            )
@@ -0,0 +1,50 @@
+""" Module for LiveDictionary class. """
+
+import threading
+
+class LiveDictionary():
+    """
+    Trie that can be edited while other threads read it.
+
+    Readers take snapshot(), a trie that never changes, and use it for as
+    long as they like. Writers are serialized by a lock. Each batch of edits
+    builds the next version with Trie.edited, which copies only the paths of
+    changed words and shares everything else. The new version replaces the
+    current one with a single assignment, so readers never wait for writers
+    and never see a half applied edit.
+    """
+
+    def __init__(self, trie):
+        """ Constructor. """
+
+        self._current = trie
+        self._lock = threading.Lock()
+
+    def snapshot(self):
+        """ Return the current version, which must not be changed in place. """
+
+        return self._current
+
+    def apply(self, add=(), remove=()):
+        """ Add (word, freq) pairs and remove words as one new version, return it. """
+
+        with self._lock:
+            trie = self._current.edited(add, remove)
+            self._current = trie
+
+        return trie
+
+    def add_word(self, word, freq=1):
+        """ Add a word in a new version. """
+
+        return self.apply(add=[(word, freq)])
+
+    def remove_word(self, word):
+        """ Remove a word in a new version, missing words are skipped. """
+
+        return self.apply(remove=[word])
+
+    def cache_key(self):
+        """ Return key identifying the current version's contents. """
+
+        return self._current.cache_key()
@@ -0,0 +1,142 @@
+""" Module for SymSpellIndex class. """
+
+from src.distance import distance
+
+class SymSpellIndex():
+    """
+    Symmetric delete index for fast spelling suggestions.
+
+    Every word is indexed under all strings reachable by deleting up to
+    max_distance letters from its first prefix_length letters. A query
+    generates the same deletes of itself, and words sharing a delete are
+    verified with a real edit distance. Shorter prefix_length means fewer
+    deletes to store, at the cost of more candidates to verify.
+    """
+
+    def __init__(self, items, max_distance=2, prefix_length=7):
+        """ Constructor, items are (word, freq) pairs. """
+
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self.freqs = {}
+        self.deletes = {}
+
+        for word, freq in items:
+            self.add_word(word, freq)
+
+    @classmethod
+    def from_trie(cls, trie, **options):
+        """ Create index holding the words of a trie. """
+
+        # pylint: disable=protected-access
+        items = [] if trie.root is None else \
+            ((word, node.freq) for word, node in trie._iter_words(trie.root))
+
+        return cls(items, **options)
+
+    def _edits(self, word):
+        """ Return all strings made by deleting up to max_distance letters of word's prefix. """
+
+        edits = {word[:self.prefix_length]}
+        level = edits
+
+        for _ in range(self.max_distance):
+            level = {edit[:i] + edit[i + 1:] for edit in level for i in range(len(edit))}
+            edits |= level
+
+        return edits
+
+    def add_word(self, word, freq=1):
+        """ Add word to index. """
+
+        if word not in self.freqs:
+            for edit in self._edits(word):
+                self.deletes.setdefault(edit, []).append(word)
+
+        self.freqs[word] = float(freq)
+
+    def remove_word(self, word):
+        """ Remove word from index. """
+
+        if self.freqs.pop(word, None) is None:
+            return
+
+        for edit in self._edits(word):
+            words = self.deletes[edit]
+            words.remove(word)
+
+            if not words:
+                del self.deletes[edit]
+
+    def edited(self, add=(), remove=()):
+        """
+        Return a new index with (word, freq) pairs in add added and words in remove removed.
+
+        The maps are copied, but only the delete lists of changed words are,
+        the rest are shared with this index, which is left unchanged.
+        """
+
+        new = type(self)((), self.max_distance, self.prefix_length)
+        new.freqs = dict(self.freqs)
+        new.deletes = deletes = dict(self.deletes)
+        copied = set()
+
+        def words_for(edit):
+            # Copy a shared list before changing it
+            if edit not in copied:
+                copied.add(edit)
+                deletes[edit] = list(deletes.get(edit, ()))
+
+            return deletes[edit]
+
+        for word, freq in add:
+            if word not in new.freqs:
+                for edit in self._edits(word):
+                    words_for(edit).append(word)
+
+            new.freqs[word] = float(freq)
+
+        for word in remove:
+            if new.freqs.pop(word, None) is None:
+                continue
+
+            for edit in self._edits(word):
+                words = words_for(edit)
+                words.remove(word)
+
+                if not words:
+                    del deletes[edit]
+                    copied.discard(edit)
+
+        return new
+
+    def lookup(self, input_word, max_distance=None, transpositions=True):
+        """ Return (word, distance, freq) for indexed words within max_distance. """
+
+        if max_distance is None or max_distance > self.max_distance:
+            max_distance = self.max_distance
+
+        suggs = []
+        seen = set()
+
+        for edit in self._edits(input_word):
+            for word in self.deletes.get(edit, ()):
+                if word in seen:
+                    continue
+
+                seen.add(word)
+
+                if abs(len(word) - len(input_word)) > max_distance:
+                    continue
+
+                dist = distance(input_word, word, transpositions, max_distance)
+
+                if dist <= max_distance:
+                    suggs.append((word, dist, self.freqs[word]))
+
+        return suggs
+
+    def __len__(self):
+        """ Return number of delete strings in index. """
+
+        return len(self.deletes)
@@ -1,27 +1,68 @@
 """ Module for Trie class. """
 
+import heapq
+import itertools
+from bisect import bisect_right
+from itertools import islice
+
 from src.node import Node
 from src.errors import SearchMiss
+from src.distance import first_row, next_row
+from src.symspell import SymSpellIndex
+from src.document import check_text
+from src.cache import next_uid
+from src.metrics import timed, nodes_visited
+from src.query import QuerySession
 
 class Trie():
-    """ Trie class. """
+    """
+    Trie class.
+
+    All traversals are iterative, using an explicit stack and a shared buffer
+    of letters for the current path, so no recursion limit applies and words
+    are only joined into strings when they are returned.
+
+    Prefix search results are cached per node, the cache of every node on the
+    path of a word is dropped when the word is added or removed. The highest
+    frequency below every node is computed on the first ranked correction
+    and then kept up to date.
+
+    Suffix search uses a second trie holding every word reversed. It is built
+    on the first suffix search and then kept up to date by add_word and
+    remove_word.
+
+    Spelling correction can optionally be served from a SymSpellIndex, see
+    enable_symspell, and membership from a set of words, see enable_word_set.
+    """
     default_dict = "static/frequency.txt"
 
+    # Number of completions cached per node by prefix_search
+    top_size = 32
+
     def __init__(self, word_list=None):
         """ Constructor. """
 
         self.root = None
+        self.suffix_index = None
+        self.symspell = None
+        self.word_set = None
+        self.num_words = 0
+
+        # Identity and number of changes, for result caches
+        self.uid = next_uid()
+        self.version = 0
 
         if word_list:
-            for item in word_list:
-                word, freq = item.split()
-                self.add_word(word, freq)
+            self.add_words(item.split() for item in word_list)
 
     @classmethod
-    def create_from_file(cls):
+    def create_from_file(cls, path=None):
         """ Create new trie object populated with words from file. """
 
-        with open(file=Trie.default_dict, mode="r", encoding="utf-8") as fd:
+        if path is None:
+            path = Trie.default_dict
+
+        with open(file=path, mode="r", encoding="utf-8") as fd:
 
             word_list = [line.rstrip("\n") for line in fd.readlines()]
 
@@ -33,280 +74,793 @@ class Trie():
         if self.root is None:
             self.root = Node()
 
-        self._add_letter(self.root, word, freq)
+        freq = float(freq)
+        node = self.root
+        node.top = None
 
-    @classmethod
-    def _add_letter(cls, node, word, freq, index=0):
-        """ Add node representing a letter. """
+        # Keep subtree maxima if they have been computed
+        track = node.best is not None
+
+        if track and freq > node.best:
+            node.best = freq
+
+        for letter in word:
+            next_node = node.children.get(letter)
+
+            # If node doesn't have node with current letter as child, create new node
+            if next_node is None:
+                next_node = node.add_child(letter)
+
+            node = next_node
+            node.top = None
+
+            if track and (node.best is None or freq > node.best):
+                node.best = freq
+
+        if not node.is_stop:
+            self.num_words += 1
+
+        node.is_stop = True
+        node.freq = freq
+
+        if self.suffix_index is not None:
+            self.suffix_index.add_word(word[::-1], freq)
+
+        if self.symspell is not None:
+            self.symspell.add_word(word, freq)
+
+        if self.word_set is not None:
+            self.word_set.add(word)
+
+        self.version += 1
+
+    def add_words(self, items, sort=False):
+        """
+        Add (word, freq) pairs in one pass.
+
+        Avoids the per word overhead of add_word, the version changes once.
+        With sort=True the pairs are sorted first, so get_all_words returns
+        them alphabetically instead of in input order.
+        """
+
+        if sort:
+            items = sorted(items)
+
+        if self.root is None:
+            self.root = Node()
+
+        root = self.root
+        root.top = None
+
+        # Subtree maxima are computed again on next use
+        root.best = None
+        suffix_index, symspell, word_set = self.suffix_index, self.symspell, self.word_set
+        num_words = self.num_words
+
+        for word, freq in items:
+            node = root
+
+            for letter in word:
+                next_node = node.children.get(letter)
+
+                if next_node is None:
+                    next_node = node.add_child(letter)
+
+                node = next_node
+                node.top = None
+
+            if not node.is_stop:
+                num_words += 1
 
-        if index >= len(word):
             node.is_stop = True
-            node.freq = freq
-            return
+            node.freq = float(freq)
 
-        letter = word[index]
+            if suffix_index is not None:
+                suffix_index.add_word(word[::-1], freq)
 
-        # If node doesn't have node with current letter as child, create new node
-        if not node.children.get(letter):
-            new_node = Node(letter)
-            node.children[letter] = new_node
+            if symspell is not None:
+                symspell.add_word(word, freq)
 
-        next_node = node.children.get(letter)
+            if word_set is not None:
+                word_set.add(word)
 
-        cls._add_letter(next_node, word, freq, index + 1)
+        self.num_words = num_words
+        self.version += 1
 
+    @timed("remove_word")
     def remove_word(self, word):
         """ Remove a word from trie. """
 
-        if self.root is None or not self.root.children.get(word[0]):
+        if self.root is None:
             raise SearchMiss
 
-        node = self.root.children.get(word[0])
+        path = [self.root]
 
-        remove = self._remove_letter(node, word)
+        for letter in word:
+            node = path[-1].children.get(letter)
 
-        if remove:
-            self.root.children.pop(node.key)
+            if node is None:
+                raise SearchMiss
 
-    @classmethod
-    def _remove_letter(cls, node, word, index=0, remove=True):
-        """ Remove child node if appropriate. """
+            path.append(node)
 
-        if index >= len(word) - 1:
-            if node.key != word[index] or not node.is_stop:
-                raise ValueError
+        if not path[-1].is_stop:
+            raise ValueError
 
-            node.is_stop = False
+        self._remove_path(word, path)
+        self.version += 1
 
-            if len(node.children) > 0:
-                remove = False
+    @timed("remove_words")
+    def remove_words(self, words):
+        """
+        Remove every word in words that trie contains, return number removed.
 
-            return remove
+        Unlike remove_word, missing words are skipped instead of raising.
+        """
 
-        if not node.children.get(word[index + 1]):
-            raise SearchMiss
+        if self.root is None:
+            return 0
 
-        next_node = node.children.get(word[index + 1])
+        root = self.root
+        removed = 0
 
-        remove = cls._remove_letter(next_node, word, index + 1, remove)
+        for word in words:
+            path = [root]
 
-        if remove:
-            node.children.pop(next_node.key)
+            for letter in word:
+                node = path[-1].children.get(letter)
 
-        if node.is_stop or len(node.children) >= 1:
-            remove = False
+                if node is None:
+                    break
 
-        return remove
+                path.append(node)
+            else:
+                if path[-1].is_stop:
+                    self._remove_path(word, path)
+                    removed += 1
+
+        if removed:
+            self.version += 1
+
+        return removed
+
+    def edited(self, add=(), remove=()):
+        """
+        Return a new trie with (word, freq) pairs in add added and words in remove removed.
+
+        Only the nodes on the paths of changed words are copied, every other
+        subtree is shared with this trie, which is left unchanged. Neither
+        trie may be changed in place afterwards. Missing words in remove are
+        skipped. The new trie keeps this one's uid with a higher version, and
+        its suffix index, SymSpell index and word set.
+        """
+
+        new = type(self)()
+        new.uid = self.uid
+        new.version = self.version + 1
+        new.num_words = self.num_words
+        new.root = root = self._copy_node(self.root) if self.root else Node()
+        owned = {root}
+        add = [(word, float(freq)) for word, freq in add]
+        remove = list(remove)
+
+        def own(parent, child):
+            # Copy child into this version unless it already is one of its nodes
+            if child not in owned:
+                child = self._copy_node(child)
+                parent.children[child.key] = child
+                owned.add(child)
+
+            return child
+
+        for word, freq in add:
+            node = root
+
+            for letter in word:
+                child = node.children.get(letter)
+                node = own(node, child) if child is not None else node.add_child(letter)
+                owned.add(node)
+
+            if not node.is_stop:
+                new.num_words += 1
 
-    def has_word(self, word):
-        """ Check if trie contains word. """
+            node.is_stop = True
+            node.freq = freq
 
-        if self.root is None:
-            raise SearchMiss
+        removed = []
 
-        return self._has_letter(self.root, word)
+        for word in remove:
+            node = root
 
-    @classmethod
-    def _has_letter(cls, node, word, index=0):
-        """ Check if letter exists at index. """
+            for letter in word:
+                node = node.children.get(letter)
 
-        letter = word[index]
+                if node is None:
+                    break
+            else:
+                if node.is_stop:
+                    path = [root]
 
-        if not node.children.get(letter):
-            raise SearchMiss
+                    for letter in word:
+                        path.append(own(path[-1], path[-1].children[letter]))
 
-        if index >= len(word) - 1:
-            if node.children.get(letter).is_stop:
-                return True
+                    path[-1].is_stop = False
+                    path[-1].freq = None
 
-            raise SearchMiss
+                    while len(path) > 1 and not (path[-1].is_stop or path[-1].children):
+                        node = path.pop()
+                        path[-1].children.pop(node.key)
 
-        node = node.children[letter]
+                    removed.append(word)
+                    new.num_words -= 1
 
-        return cls._has_letter(node, word, index + 1)
+        # Subtree maxima of copied nodes, children first
+        if self.root is not None and self.root.best is not None:
+            order = []
+            stack = [root]
 
-    def get_num_words(self):
-        """ Return number of words in trie. """
+            while stack:
+                node = stack.pop()
+                order.append(node)
+                stack.extend(child for child in node.children.values() if child in owned)
 
-        if self.root is None:
-            return 0
+            for node in reversed(order):
+                node.best = self._node_best(node)
 
-        return self._count_words(self.root)
+        if self.suffix_index is not None:
+            new.suffix_index = self.suffix_index.edited(
+                [(word[::-1], freq) for word, freq in add], [word[::-1] for word in removed])
 
-    @classmethod
-    def _count_words(cls, node, count=0):
-        """ Count stop nodes. """
+        if self.word_set is not None:
+            new.word_set = (self.word_set | {word for word, _ in add}) - set(removed)
 
-        if node.is_stop:
-            count += 1
+        if self.symspell is not None:
+            new.symspell = self.symspell.edited(add, removed)
 
-        if len(node.children) == 0:
-            return count
+        return new
 
-        for child in node.children.values():
-            count = cls._count_words(child, count)
+    @staticmethod
+    def _copy_node(node):
+        """ Return copy of node sharing its children, without caches. """
 
-        return count
+        copy = Node(node.key)
+        copy.is_stop = node.is_stop
+        copy.freq = node.freq
 
-    def get_all_words(self):
-        """ Return a list with all words in trie. """
+        if node.children:
+            copy.children = dict(node.children)
 
-        word_list = []
+        return copy
 
-        self._append_word(self.root, word_list)
+    def _remove_path(self, word, path):
+        """
+        Unmark the stop node at the end of path, the nodes from root to word.
 
-        return word_list
+        Drops the prefix caches along the path, updates the indexes and
+        prunes nodes that no longer lead to any word.
+        """
 
-    @classmethod
-    def _append_word(cls, node, lst, word=""):
-        """ Append word to list. """
+        path[-1].is_stop = False
+        path[-1].freq = None
+        self.num_words -= 1
 
-        if node.key:
-            word += node.key
+        for node in path:
+            node.top = None
 
-        if node.is_stop:
-            lst.append(word)
+        if self.suffix_index is not None:
+            self.suffix_index.remove_word(word[::-1])
 
-        if len(node.children) == 0:
-            return
+        if self.symspell is not None:
+            self.symspell.remove_word(word)
+
+        if self.word_set is not None:
+            self.word_set.discard(word)
+
+        nodes = path[:]
+
+        # Drop nodes that no longer lead to any word, from the bottom up
+        while len(path) > 1:
+            node = path.pop()
+
+            if node.is_stop or node.children:
+                break
+
+            path[-1].children.pop(node.key)
+
+        if self.root.best is not None:
+            for node in reversed(nodes):
+                node.best = self._node_best(node)
+
+    @staticmethod
+    def _node_best(node):
+        """ Return highest frequency at or below node from its children's. """
+
+        best = node.freq if node.is_stop else float("-inf")
 
         for child in node.children.values():
-            cls._append_word(child, lst, word)
+            if child.best > best:
+                best = child.best
 
-    def prefix_search(self, prefix):
-        """ Return all words starting with prefix. """
+        return best
 
-        word_list = []
+    def _update_best(self):
+        """ Compute the highest frequency below every node, children first. """
 
-        if self.root is None:
-            return word_list
+        order = []
+        stack = [self.root]
+
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            stack.extend(node.children.values())
+
+        for node in reversed(order):
+            node.best = self._node_best(node)
+
+    def cache_key(self):
+        """ Return key identifying the current contents of trie. """
+
+        return (self.uid, self.version)
+
+    def _find(self, prefix):
+        """ Return node reached by prefix, or None if missing. """
 
         node = self.root
 
-        for letter in prefix:
-            if not node.children.get(letter):
-                return word_list
+        if node is None:
+            return None
 
+        for letter in prefix:
             node = node.children.get(letter)
 
-        self._prefix_search(node, word_list, prefix[:-1])
+            if node is None:
+                return None
 
-        def freq_sort(e):
-            return float(e[1])
+        return node
 
-        word_list.sort(reverse=True, key=freq_sort)
+    @timed("has_word")
+    def has_word(self, word, exclude=None):
+        """ Check if trie contains word, words in exclude count as missing. """
 
-        if len(word_list) > 10:
-            word_list = word_list[:10]
+        if not self.contains(word, exclude):
+            raise SearchMiss
 
-        return word_list
+        return True
+
+    def contains(self, word, exclude=None):
+        """ Return True if trie contains word, like has_word but without raising. """
+
+        if exclude and word in exclude:
+            return False
+
+        if self.word_set is not None:
+            return word in self.word_set
+
+        node = self._find(word)
+
+        return node is not None and node is not self.root and node.is_stop
+
+    @timed("contains_many")
+    def contains_many(self, words, exclude=None):
+        """ Return list of booleans telling which words trie contains. """
+
+        if self.word_set is not None:
+            word_set = self.word_set
+
+            return [word in word_set and not (exclude and word in exclude) for word in words]
+
+        contains = self.contains
+
+        return [contains(word, exclude) for word in words]
+
+    @timed("get_num_words")
+    def get_num_words(self):
+        """ Return number of words in trie, counted as they are added and removed. """
+
+        return self.num_words
 
     @classmethod
-    def _prefix_search(cls, node, lst, word=""):
-        """ Return all words starting with prefix (rec). """
+    def _iter_words(cls, node, prefix="", traversal="iter_words"):
+        """
+        Yield (word, node) for node and every stop node below it.
 
-        word += node.key
+        Words are yielded depth-first in insertion order, prefix is the word
+        that node itself represents. Visited nodes are counted under traversal.
+        """
 
         if node.is_stop:
-            lst.append((word, float(node.freq)))
+            yield prefix, node
 
-        if len(node.children) == 0:
-            return
+        buf = list(prefix)
+        depth = len(buf)
+        stack = [iter(node.children.values())]
+        visited = 1
 
-        for child in node.children.values():
-            cls._prefix_search(child, lst, word)
+        try:
+            while stack:
+                for child in stack[-1]:
+                    buf.append(child.key)
+                    visited += 1
+
+                    if child.is_stop:
+                        yield "".join(buf), child
+
+                    # Descend, the parent iterator is resumed when child is done
+                    if child.children:
+                        stack.append(iter(child.children.values()))
+                        break
+
+                    buf.pop()
+                else:
+                    stack.pop()
+
+                    if len(buf) > depth:
+                        buf.pop()
+        finally:
+            nodes_visited.inc(visited, traversal=traversal)
 
-    def correct_spelling(self, input_word):
-        """ * """
+    @timed("get_all_words")
+    def get_all_words(self, exclude=None):
+        """ Return a list with all words in trie. """
 
         if self.root is None:
             return []
 
-        suggs = []
+        return [word for word, _ in self._iter_words(self.root, traversal="get_all_words")
+                if not (exclude and word in exclude)]
+
+    def iter_words(self, start="", offset=0, limit=None, exclude=None):
+        """
+        Return lazy iterator over words in alphabetical order.
+
+        Starts at the first word not before start, skips offset words and
+        stops after limit words. Children are sorted as they are visited, so
+        nothing is collected up front and the first words come right away.
+        """
+
+        stop = None if limit is None else offset + limit
+
+        return islice(self._iter_sorted(start, exclude), offset, stop)
+
+    def _iter_sorted(self, start, exclude):
+        """ Yield words from start on alphabetically, see iter_words. """
+
+        if self.root is None:
+            return
+
+        node = self.root
+        buf = []
+        stack = []
+
+        # Seek along start, at each level only the letters after it are left
+        for letter in start:
+            keys = sorted(node.children)
+            stack.append(iter([node.children[key] for key in keys[bisect_right(keys, letter):]]))
+            node = node.children.get(letter)
+
+            if node is None:
+                break
+
+            buf.append(letter)
+        else:
+            if node.is_stop and not (exclude and start in exclude):
+                yield start
+
+            stack.append(iter([node.children[key] for key in sorted(node.children)]))
+
+        while stack:
+            for child in stack[-1]:
+                buf.append(child.key)
+
+                if child.is_stop:
+                    word = "".join(buf)
+
+                    if not (exclude and word in exclude):
+                        yield word
+
+                # Descend, the parent iterator is resumed when child is done
+                if child.children:
+                    children = child.children
+                    stack.append(iter([children[key] for key in sorted(children)]))
+                    break
+
+                buf.pop()
+            else:
+                stack.pop()
+
+                if buf:
+                    buf.pop()
+
+    @timed("prefix_search")
+    def prefix_search(self, prefix, k=10, exclude=None):
+        """
+        Return the k most frequent (word, freq) pairs starting with prefix.
+
+        Ties are ordered alphabetically. Answered from the prefix node's cache
+        when possible, otherwise the subtree is walked with a heap.
+        """
+
+        node = self._find(prefix)
+
+        if node is None or node is self.root:
+            return []
+
+        return self._node_top(node, prefix, k, exclude)
+
+    def _node_top(self, node, prefix, k, exclude=None):
+        """ Return the k most frequent (word, freq) pairs at or below node, using its cache. """
+
+        if node.top is None:
+            node.top = self._top_words(node, prefix, self.top_size)
+
+        word_list = node.top
+
+        if exclude:
+            word_list = [item for item in word_list if item[0] not in exclude]
+
+        # The cache holds every word below node if it isn't full
+        if len(word_list) >= k or len(node.top) < self.top_size:
+            return word_list[:k]
+
+        return self._top_words(node, prefix, k, exclude)
+
+    @classmethod
+    def _top_words(cls, node, prefix, k, exclude=None):
+        """ Return the k most frequent (word, freq) pairs at or below node. """
+
+        words = cls._iter_words(node, prefix, traversal="prefix_search")
+        items = ((word, stop.freq) for word, stop in words
+                 if not (exclude and word in exclude))
+
+        return heapq.nsmallest(k, items, key=lambda item: (-item[1], item[0]))
+
+    @timed("correct_spelling")
+    def correct_spelling(self, input_word, max_distance=2, transpositions=True, limit=10,
+                         exclude=None):
+        """
+        Return up to limit words within max_distance edits of input word.
+
+        Insertions, deletions, substitutions and, if transpositions is set,
+        swaps of adjacent letters count as one edit each. Results are ordered
+        by distance, then frequency. A word in the trie is its own only
+        suggestion.
+
+        Unless served by the SymSpell index, the trie is searched best-first
+        and only as far as needed for limit words. With limit=None every
+        word within max_distance is collected.
+        """
+
+        if self.root is None:
+            return []
 
         try:
-            self.has_word(input_word)
-            suggs.append(input_word)
+            self.has_word(input_word, exclude)
+            return [input_word]
         except SearchMiss:
             # Input word is not in trie
-            self._correct_spelling(self.root, suggs, input_word)
+            pass
+
+        if self.symspell is None or max_distance > self.symspell.max_distance:
+            if limit is not None:
+                if self.root.best is None:
+                    self._update_best()
+
+                suggs = self._best_corrections(self.root, input_word, max_distance,
+                                               transpositions, limit, exclude)
+
+                return [word for word, _, _ in suggs]
+
+            suggs = self._correct_spelling(self.root, input_word, max_distance, transpositions)
+        else:
+            suggs = self.symspell.lookup(input_word, max_distance, transpositions)
+
+        if exclude:
+            suggs = [sugg for sugg in suggs if sugg[0] not in exclude]
+
+        suggs.sort(key=lambda sugg: (sugg[1], -sugg[2], sugg[0]))
+
+        return [word for word, _, _ in suggs[:limit]]
+
+    def enable_symspell(self, max_distance=2, prefix_length=7):
+        """
+        Build a symmetric delete index used by correct_spelling.
+
+        Queries with a max_distance above the index's still walk the trie.
+        """
 
-        suggs.sort()
+        self.symspell = SymSpellIndex.from_trie(self, max_distance=max_distance,
+                                                prefix_length=prefix_length)
+
+    def enable_word_set(self):
+        """
+        Keep a set of all words, answering membership without walking the trie.
+
+        Costs about 3.5 MB for frequency.txt and is kept up to date by
+        add_word and remove_word.
+        """
+
+        self.word_set = set(self.get_all_words())
+
+    @classmethod
+    def _correct_spelling(cls, root, input_word, max_distance, transpositions):
+        """
+        Return (word, distance, freq) for words within max_distance of input.
+
+        Walks the trie keeping one edit distance row per node, and skips the
+        subtree of a node once no extension of its path can get close enough.
+        """
+
+        suggs = []
+        buf = []
+        root_row = first_row(input_word)
+        stack = [(child, 0, root_row, None, None) for child in root.children.values()]
+        push = stack.append
+        visited = 0
+
+        while stack:
+            node, depth, prev_row, prev_prev_row, prev_letter = stack.pop()
+            visited += 1
+            key = node.key
+
+            del buf[depth:]
+            buf.append(key)
+
+            row = next_row(input_word, prev_row, key,
+                           prev_prev_row if transpositions else None, prev_letter)
+
+            if node.is_stop and row[-1] <= max_distance:
+                suggs.append(("".join(buf), row[-1], node.freq))
+
+            # A transposition can still lower the next row by one edit
+            if min(row) > max_distance and not (transpositions and min(prev_row) < max_distance):
+                continue
+
+            depth += 1
+
+            for child in node.children.values():
+                push((child, depth, row, prev_row, key))
+
+        nodes_visited.inc(visited, traversal="correct_spelling")
 
         return suggs
 
     @classmethod
-    def _correct_spelling(cls, node, suggs, input_word, current_word="", wrong=False):
-        """ Give word suggestions based on input. """
+    def _best_corrections(cls, root, input_word, max_distance, transpositions, k,
+                          exclude=None):
+        """
+        Return the k best (word, distance, freq) within max_distance, best first.
+
+        Explores nodes best-first, ranked by a lower bound on the distance of
+        any word below them and by the highest frequency below them. A word
+        is taken when it ranks before every unexplored node, so the search
+        stops after k words without enumerating the other candidates.
+        """
+
+        seq = itertools.count()
+        suggs = []
 
-        if len(current_word) == len(input_word):
-            return
+        if k < 1:
+            return suggs
+
+        # Nodes are (bound, -best, 0, seq, node, word, row, prev_row), words
+        # are (distance, -freq, 1, word), so a node ranks before a word it ties with
+        heap = []
+        expand = [(root, "", first_row(input_word), None)]
+        visited = 0
+
+        while True:
+            for node, word, prev_row, prev_prev_row in expand:
+                prev_letter = word[-1:] or None
+
+                for child in node.children.values():
+                    visited += 1
+                    row = next_row(input_word, prev_row, child.key,
+                                   prev_prev_row if transpositions else None, prev_letter)
+                    bound = min(row)
+
+                    # A transposition can still lower the next row by one edit
+                    if transpositions:
+                        bound = min(bound, min(prev_row) + 1)
+
+                    if bound > max_distance:
+                        continue
+
+                    child_word = word + child.key
+
+                    if (child.is_stop and row[-1] <= max_distance
+                            and not (exclude and child_word in exclude)):
+                        heapq.heappush(heap, (row[-1], -child.freq, 1, child_word))
+
+                    if child.children:
+                        heapq.heappush(heap, (bound, -child.best, 0, next(seq), child,
+                                              child_word, row, prev_row))
 
-        if node.key:
-            current_word += node.key
+            if not heap:
+                break
 
-            if input_word[len(current_word) - 1] != current_word[-1]:
-                if wrong:
-                    return
+            item = heapq.heappop(heap)
+            expand = ()
 
-                wrong = True
+            if item[2]:
+                suggs.append((item[3], item[0], -item[1]))
+
+                if len(suggs) == k:
+                    break
             else:
-                wrong = False
+                expand = (item[4:],)
 
-        if node.is_stop and len(current_word) == len(input_word):
-            if current_word[-1] == input_word[-1]:
-                suggs.append(current_word)
+        nodes_visited.inc(visited, traversal="correct_spelling")
 
-        if len(node.children) == 0:
-            return
+        return suggs
 
-        for child in node.children.values():
-            cls._correct_spelling(child, suggs, input_word, current_word, wrong)
+    def query_session(self, max_distance=2, transpositions=True, exclude=None):
+        """
+        Return QuerySession answering queries for text typed one letter at a time.
 
-    def suffix_search(self, suffix):
-        """ Return words with matching suffix. """
+        Only the node engine has it, the session steps through Node objects.
+        """
 
-        if self.root is None:
+        return QuerySession(self, max_distance, transpositions, exclude)
+
+    @timed("check_text")
+    def check_text(self, text, suggestions=5, **options):
+        """ Return misspelled words in text with offsets and suggestions, see check_text. """
+
+        return check_text(self, text, suggestions, **options)
+
+    def _suffix_index(self):
+        """ Return trie of reversed words, building it on first use. """
+
+        if self.suffix_index is None:
+            index = Trie()
+
+            if self.root is not None:
+                for word, node in self._iter_words(self.root):
+                    index.add_word(word[::-1], node.freq)
+
+            self.suffix_index = index
+
+        return self.suffix_index
+
+    @timed("suffix_search")
+    def suffix_search(self, suffix, limit=None, exclude=None):
+        """
+        Return words ending with suffix, most frequent first.
+
+        Looked up as a prefix of the reversed words in the suffix index.
+        """
+
+        if self.root is None or not suffix:
             return []
 
-        node = self.root
-        lst = []
+        index = self._suffix_index()
+        reverse = suffix[::-1]
 
-        self._suffix_search(node, suffix, lst)
+        if limit is not None and not exclude:
+            # The index breaks ties by reversed word, its top limit words are
+            # the right ones unless the next word ties with the last
+            top = [(word[::-1], freq) for word, freq in index.prefix_search(reverse, limit + 1)]
 
-        lst.sort()
+            if len(top) <= limit or top[limit - 1][1] != top[limit][1]:
+                top.sort(key=lambda item: (-item[1], item[0]))
 
-        return lst
+                return [word for word, _ in top[:limit]]
 
-    @classmethod
-    def _suffix_search(cls, node, suffix, lst, suffix_index=0, word=""):
-        """ Return words with matching suffix (rec). """
-
-        if node.key:
-            word += node.key
-
-            # Check if node key matches current letter in suffix
-            if node.key == suffix[suffix_index]:
-
-                # Check if current letter is the last in suffix
-                if suffix_index == len(suffix) - 1:
-                    # Add word to list if node is stop
-                    if node.is_stop:
-                        #print("adding to list: ", word)
-                        lst.append(word)
-                    # Reset suffix index
-                    suffix_index = 0
-                else:
-                    suffix_index += 1
-            else:
-                suffix_index = 0
+        # pylint: disable=protected-access
+        node = index._find(reverse)
 
-        # Return if node is leaf
-        if len(node.children) == 0:
-            return
+        if node is None:
+            return []
 
-        for child in node.children.values():
-            cls._suffix_search(child, suffix, lst, suffix_index, word)
+        words = index._iter_words(node, reverse, traversal="suffix_search")
+        items = [(word[::-1], stop.freq) for word, stop in words]
+
+        if exclude:
+            items = [item for item in items if item[0] not in exclude]
+
+        items.sort(key=lambda item: (-item[1], item[0]))
+
+        return [word for word, _ in items[:limit]]
 
 if __name__ == "__main__":
     trie = Trie.create_from_file()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+
+""" Module for testing the JSON API. """
+
+import asyncio
+import json
+import unittest
+import asgi
+from src.api import handle
+from src.trie import Trie
+
+class TestApi(unittest.TestCase):
+    """ Submodule for unit tests, inherits from unittest.TestCase. """
+
+    @classmethod
+    def setUpClass(cls):
+        """ Build the shared trie once. """
+        cls.trie = Trie.create_from_file()
+
+    def test_check(self):
+        """ Test checking single words. """
+
+        self.assertEqual(handle(self.trie, "check", {"word": "Many"}),
+                         (200, {"word": "many", "found": True}))
+        self.assertEqual(handle(self.trie, "check", {"word": "wrod"})[1]["found"], False)
+
+    def test_prefix(self):
+        """ Test prefix results with frequencies. """
+
+        status, body = handle(self.trie, "prefix", {"prefix": "ba", "k": "2"})
+
+        self.assertEqual(status, 200)
+        self.assertEqual(body["results"], [{"word": "back", "freq": 740270.0},
+                                           {"word": "battle", "freq": 108781.0}])
+
+    def test_bad_requests(self):
+        """ Test missing and invalid parameters and unknown endpoints. """
+
+        self.assertEqual(handle(self.trie, "prefix", {})[0], 400)
+        self.assertEqual(handle(self.trie, "correct", {"word": "wrod", "limit": "x"})[0], 400)
+        self.assertEqual(handle(self.trie, "nope", {})[0], 404)
+
+    def test_asgi(self):
+        """ Test a request through the ASGI app. """
+
+        factory = asgi.dictionaries.factory
+        self.addCleanup(setattr, asgi.dictionaries, "factory", factory)
+        asgi.dictionaries.factory = lambda path: self.trie
+
+        scope = {"type": "http", "method": "POST", "path": "/api/batch", "query_string": b""}
+        body = json.dumps({"text": "many wrod", "suggestions": 1}).encode()
+        sent = []
+
+        async def receive():
+            return {"type": "http.request", "body": body}
+
+        async def send(message):
+            sent.append(message)
+
+        asyncio.run(asgi.app(scope, receive, send))
+
+        self.assertEqual(sent[0]["status"], 200)
+        self.assertEqual(json.loads(sent[1]["body"]),
+                         {"misspelled": [{"word": "wrod", "offsets": [[5, 9]],
+                                          "suggestions": ["word"]}]})
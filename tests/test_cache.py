@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+
+""" Module for testing classes LRUCache and ResultCache. """
+
+import time
+import unittest
+from src.trie import Trie
+from src.overlay import TrieView
+from src.cache import LRUCache, ResultCache
+
+class TestCache(unittest.TestCase):
+    """ Submodule for unit tests, inherits from unittest.TestCase. """
+
+    def setUp(self):
+        """ Standard setup before every test case is run. """
+        # Arrange
+        self.trie = Trie.create_from_file("static/tiny_frequency.txt")
+        self.cache = ResultCache(maxsize=2)
+
+    def test_lru_eviction(self):
+        """ Test that the least recently used entry is evicted. """
+
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.stats(), {"hits": 2, "misses": 1, "evictions": 1,
+                                         "expirations": 0, "size": 2})
+
+    def test_ttl(self):
+        """ Test that entries expire. """
+
+        cache = LRUCache(ttl=0.01)
+        cache.put("a", 1)
+        time.sleep(0.02)
+
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.expirations, 1)
+
+    def test_call_is_cached(self):
+        """ Test that repeated calls hit the cache. """
+
+        first = self.cache.call(self.trie, "prefix_search", "po")
+
+        self.assertIs(self.cache.call(self.trie, "prefix_search", "po"), first)
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(self.cache.misses, 1)
+
+    def test_invalidated_by_changes(self):
+        """ Test that added words and removed session words miss the cache. """
+
+        self.cache.call(self.trie, "prefix_search", "po")
+
+        self.trie.add_word("pozz", 9e9)
+        self.assertEqual(self.cache.call(self.trie, "prefix_search", "po", k=1), [("pozz", 9e9)])
+
+        view = TrieView(self.trie)
+        self.assertEqual(self.cache.call(view, "prefix_search", "po", k=1), [("pozz", 9e9)])
+
+        view.remove_word("pozz")
+        self.assertNotEqual(self.cache.call(view, "prefix_search", "po", k=1), [("pozz", 9e9)])
+        self.assertEqual(self.cache.misses, 4)
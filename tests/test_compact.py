@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+
+""" Module for testing class CompactTrie. """
+
+import os
+import shutil
+import tempfile
+import unittest
+from src.trie import Trie
+from src.compact import CompactTrie
+from src.errors import SearchMiss
+
+class TestCompactTrie(unittest.TestCase):
+    """ Submodule for unit tests, inherits from unittest.TestCase. """
+
+    @classmethod
+    def setUpClass(cls):
+        """ Build both engines once. """
+        cls.trie = Trie.create_from_file()
+        cls.compact = CompactTrie.create_from_file()
+
+    def test_create_from_file(self):
+        """ Test that create_from_file works as expected. """
+
+        self.assertEqual(self.compact.get_num_words(), 25402)
+
+        self.assertTrue(self.compact.has_word("many"))
+        self.assertTrue(self.compact.has_word("together"))
+
+        with self.assertRaises(SearchMiss) as _:
+            self.compact.has_word("moonwalk")
+
+        with self.assertRaises(SearchMiss) as _:
+            self.compact.has_word("toget")
+
+    def test_create_empty(self):
+        """ Test creating empty trie. """
+
+        compact = CompactTrie()
+        self.assertEqual(compact.get_num_words(), 0)
+        self.assertEqual(compact.prefix_search("ba"), [])
+
+        with self.assertRaises(SearchMiss) as _:
+            compact.has_word("many")
+
+    def test_contains(self):
+        """ Test non-raising membership, with and without the word set. """
+
+        words = ["understand", "moonwalk", "", "und"]
+
+        self.assertEqual(self.compact.contains_many(words), [True, False, False, False])
+
+        self.compact.enable_word_set()
+
+        self.assertEqual(self.compact.contains_many(words, exclude={"understand"}),
+                         [False, False, False, False])
+        self.assertTrue(self.compact.has_word("understand"))
+
+    def test_from_trie(self):
+        """ Test converting a node based trie. """
+
+        compact = CompactTrie.from_trie(self.trie)
+
+        self.assertEqual(compact.get_all_words(), self.compact.get_all_words())
+
+    def test_get_all_words(self):
+        """ Test that all words are listed alphabetically. """
+
+        self.assertEqual(self.compact.get_all_words(), sorted(self.trie.get_all_words()))
+
+    def test_iter_words(self):
+        """ Test that seeking gives the same pages as the node trie. """
+
+        for start in ["", "moon", "moond", "ba", "zzz"]:
+            self.assertEqual(list(self.compact.iter_words(start, offset=1, limit=5)),
+                             list(self.trie.iter_words(start, offset=1, limit=5)))
+
+    def test_prefix_search(self):
+        """ Test that prefix search returns expected results. """
+
+        self.assertEqual(self.compact.prefix_search("ba"), self.trie.prefix_search("ba"))
+        self.assertEqual(self.compact.prefix_search("xyz"), [])
+        self.assertEqual(self.compact.prefix_search(""), self.trie.prefix_search(""))
+
+    def test_correct_spelling(self):
+        """ Test that both engines give the same suggestions. """
+
+        for word in ["bamk", "togethir", "many", "wrod", "helo"]:
+            self.assertEqual(self.compact.correct_spelling(word),
+                             self.trie.correct_spelling(word))
+
+    def test_suffix_search(self):
+        """ Test that both engines find the same words. """
+
+        self.assertEqual(self.compact.suffix_search("ing"), self.trie.suffix_search("ing"))
+
+class TestCompiledTrie(unittest.TestCase):
+    """ Submodule for unit tests of compiled files, inherits from unittest.TestCase. """
+
+    def setUp(self):
+        """ Standard setup before every test case is run. """
+        # Arrange
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, "tiny_frequency.txt")
+        shutil.copy("static/tiny_frequency.txt", self.path)
+
+    def tearDown(self):
+        """ Clean up after every test case. """
+        shutil.rmtree(self.tmp_dir)
+
+    def test_open_compiles(self):
+        """ Test that open writes a compiled file and maps it. """
+
+        trie = CompactTrie.open(self.path)
+
+        self.assertTrue(os.path.exists(self.path + CompactTrie.compiled_suffix))
+        self.assertIsInstance(trie.freqs, memoryview)
+        self.assertEqual(trie.get_all_words(),
+                         CompactTrie.create_from_file(self.path).get_all_words())
+        self.assertEqual(trie.prefix_search("po"),
+                         CompactTrie.create_from_file(self.path).prefix_search("po"))
+
+    def test_open_rebuilds_stale(self):
+        """ Test that a compiled file is rebuilt when the text file changes. """
+
+        CompactTrie.open(self.path)
+
+        with open(self.path, mode="a", encoding="utf-8") as fd:
+            fd.write("\nmoonwalk 12")
+
+        self.assertTrue(CompactTrie.open(self.path).has_word("moonwalk"))
+
+    def test_load_rejects_bad_file(self):
+        """ Test that files that aren't compiled tries are rejected. """
+
+        with self.assertRaises(ValueError) as _:
+            CompactTrie.load(self.path)
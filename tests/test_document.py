@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+
+""" Module for testing text checking. """
+
+import io
+import unittest
+from src.trie import Trie
+from src.overlay import TrieView
+from src.document import tokenize, check_stream
+
+class TestDocument(unittest.TestCase):
+    """ Submodule for unit tests, inherits from unittest.TestCase. """
+
+    @classmethod
+    def setUpClass(cls):
+        """ Build the shared trie once. """
+        cls.trie = Trie.create_from_file()
+
+    def test_tokenize(self):
+        """ Test that words are lowercased with offsets, other chars skipped. """
+
+        self.assertEqual(list(tokenize("Many, 42 wrods!")),
+                         [("many", 0, 4), ("wrods", 9, 14)])
+
+    def test_check_text(self):
+        """ Test that misspelled words are grouped with all offsets. """
+
+        text = "Many wrod here, another wrod with bamk."
+
+        misspelled = self.trie.check_text(text, suggestions=2)
+
+        self.assertEqual([item["word"] for item in misspelled], ["wrod", "bamk"])
+        self.assertEqual(misspelled[0]["offsets"], [(5, 9), (24, 28)])
+        self.assertEqual(misspelled[0]["suggestions"], ["word", "wood"])
+        self.assertEqual(text[34:38], "bamk")
+
+    def test_check_text_view(self):
+        """ Test that removed words are reported as misspelled. """
+
+        view = TrieView(self.trie, ["many"])
+
+        misspelled = view.check_text("many words", suggestions=0)
+
+        self.assertEqual(misspelled, [{"word": "many", "offsets": [(0, 4)], "suggestions": []}])
+
+    def test_check_stream(self):
+        """ Test that words split between chunks are found with line and column. """
+
+        text = "Many wrod here\nanother  bamk\n\nwrod xyzq"
+        ctl_lst = [(1, 6, "wrod", []), (2, 10, "bamk", []), (4, 1, "wrod", []), (4, 6, "xyzq", [])]
+
+        for chunk_size in [1, 3, 7, 1000]:
+            misspelled = list(check_stream(self.trie, io.StringIO(text), chunk_size))
+            self.assertEqual(misspelled, ctl_lst)
+
+    def test_check_stream_suggestions(self):
+        """ Test that suggestions are given when asked for. """
+
+        misspelled = list(check_stream(self.trie, io.StringIO("wrod"), suggestions=1))
+
+        self.assertEqual(misspelled, [(1, 1, "wrod", ["word"])])
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+
+""" Module for testing the metrics module. """
+
+import time
+import unittest
+from src.trie import Trie
+from src import metrics
+from src.metrics import MetricsRegistry, SamplingProfiler, method_seconds, nodes_visited
+
+class TestMetrics(unittest.TestCase):
+    """ Submodule for unit tests, inherits from unittest.TestCase. """
+
+    def setUp(self):
+        """ Standard setup before every test case is run. """
+        # Arrange
+        self.registry = MetricsRegistry()
+
+    def test_render_counter(self):
+        """ Test that counters render in Prometheus text format. """
+
+        counter = self.registry.counter("hits_total", "Hits.", ["route"])
+        counter.inc(route="/a")
+        counter.inc(2, route="/a")
+
+        self.assertEqual(self.registry.render(),
+                         '# HELP hits_total Hits.\n'
+                         '# TYPE hits_total counter\n'
+                         'hits_total{route="/a"} 3\n')
+
+    def test_histogram_buckets(self):
+        """ Test that histogram buckets are cumulative. """
+
+        histogram = self.registry.histogram("latency", "Latency.", buckets=(1, 10))
+        histogram.observe(0.5)
+        histogram.observe(5)
+        histogram.observe(50)
+
+        text = self.registry.render()
+
+        self.assertIn('latency_bucket{le="1"} 1\n', text)
+        self.assertIn('latency_bucket{le="10"} 2\n', text)
+        self.assertIn('latency_bucket{le="+Inf"} 3\n', text)
+        self.assertIn('latency_count 3\n', text)
+        self.assertIn('latency_sum 55.5\n', text)
+
+    def test_collector(self):
+        """ Test that collectors are read when rendering. """
+
+        self.registry.register_collector("size", "Size.", "gauge",
+                                         lambda: {(("cache", "a"),): 7})
+
+        self.assertIn('size{cache="a"} 7\n', self.registry.render())
+
+    def test_trie_instrumentation(self):
+        """ Test that trie methods are timed and traversals counted. """
+
+        trie = Trie.create_from_file("static/tiny_frequency.txt")
+        calls = method_seconds.count(method="correct_spelling")
+        visited = nodes_visited.value(traversal="correct_spelling")
+
+        trie.correct_spelling("mooon")
+
+        self.assertEqual(method_seconds.count(method="correct_spelling"), calls + 1)
+        self.assertGreater(nodes_visited.value(traversal="correct_spelling"), visited)
+
+    def test_method_timing_off(self):
+        """ Test that methods are left unwrapped when method timing is off. """
+
+        def method():
+            return 1
+
+        enabled = metrics.method_timing
+
+        try:
+            metrics.method_timing = False
+            self.assertIs(metrics.timed("method")(method), method)
+
+            metrics.method_timing = True
+            self.assertIsNot(metrics.timed("method")(method), method)
+        finally:
+            metrics.method_timing = enabled
+
+    def test_profiler(self):
+        """ Test that the profiler samples running threads. """
+
+        profiler = SamplingProfiler(interval=0.001)
+        profiler.start()
+        end = time.perf_counter() + 0.1
+
+        while time.perf_counter() < end:
+            pass
+
+        profiler.stop()
+
+        self.assertFalse(profiler.running)
+        self.assertIn("test_profiler", profiler.report())
+
+        profiler.clear()
+        self.assertEqual(profiler.report(), "")
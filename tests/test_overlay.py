@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+
+""" Module for testing class TrieView. """
+
+import unittest
+from src.trie import Trie
+from src.compact import CompactTrie
+from src.overlay import TrieView
+from src.errors import SearchMiss
+
+class TestTrieView(unittest.TestCase):
+    """ Submodule for unit tests, inherits from unittest.TestCase. """
+
+    @classmethod
+    def setUpClass(cls):
+        """ Build the shared trie once. """
+        cls.trie = Trie.create_from_file()
+
+    def setUp(self):
+        """ Standard setup before every test case is run. """
+        # Arrange
+        self.view = TrieView(self.trie, ["back", "bank"])
+
+    def test_removed_word_is_missing(self):
+        """ Test that removed words are hidden but stay in shared trie. """
+
+        with self.assertRaises(SearchMiss) as _:
+            self.view.has_word("back")
+
+        self.assertTrue(self.trie.has_word("back"))
+        self.assertTrue(self.view.has_word("battle"))
+
+    def test_remove_word(self):
+        """ Test removing words through the view. """
+
+        self.view.remove_word("understand")
+
+        with self.assertRaises(SearchMiss) as _:
+            self.view.has_word("understand")
+
+        with self.assertRaises(SearchMiss) as _:
+            self.view.remove_word("understand")
+
+        with self.assertRaises(SearchMiss) as _:
+            self.view.remove_word("moonwalk")
+
+        self.assertTrue(self.trie.has_word("understand"))
+
+    def test_views_are_independent(self):
+        """ Test that two views over the same trie don't share removals. """
+
+        view2 = TrieView(self.trie)
+
+        self.assertTrue(view2.has_word("back"))
+        self.assertEqual(view2.get_num_words(), 25402)
+        self.assertEqual(self.view.get_num_words(), 25400)
+
+    def test_prefix_search(self):
+        """ Test that removed words are left out of prefix search. """
+
+        words = [item[0] for item in self.view.prefix_search("ba")]
+
+        self.assertEqual(len(words), 10)
+        self.assertNotIn("back", words)
+        self.assertNotIn("bank", words)
+        self.assertEqual(words[0], "battle")
+
+    def test_get_all_words(self):
+        """ Test that removed words are left out of word list. """
+
+        wrd_lst = self.view.get_all_words()
+
+        self.assertEqual(len(wrd_lst), 25400)
+        self.assertNotIn("back", wrd_lst)
+
+    def test_iter_words(self):
+        """ Test that removed words are skipped when iterating. """
+
+        self.assertNotIn("back", list(self.view.iter_words("back", limit=5)))
+        self.assertIn("back", list(self.trie.iter_words("back", limit=5)))
+
+    def test_query_session_needs_node_engine(self):
+        """ Test that a view of a compact trie refuses query sessions clearly. """
+
+        view = TrieView(CompactTrie.create_from_file("static/tiny_frequency.txt"))
+
+        with self.assertRaises(TypeError) as _:
+            view.query_session()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+
+""" Module for testing parallel batch checking. """
+
+import gc
+import threading
+import unittest
+from unittest import mock
+from src.trie import Trie
+from src.parallel import correct_many, check_many
+
+class TestParallel(unittest.TestCase):
+    """ Submodule for unit tests, inherits from unittest.TestCase. """
+
+    def setUp(self):
+        """ Standard setup before every test case is run. """
+        # Arrange
+        self.trie = Trie.create_from_file("static/tiny_frequency.txt")
+
+    def test_correct_many(self):
+        """ Test that results match serial calls and keep input order. """
+
+        words = ["bamk", "possible", "hame", "wrod", "posible"] * 5
+
+        self.assertEqual(correct_many(words, self.trie, workers=2, chunk_size=3),
+                         [self.trie.correct_spelling(word) for word in words])
+
+    def test_keeps_earlier_freeze(self):
+        """ Test that objects frozen before the call stay frozen after it. """
+
+        gc.freeze()
+
+        try:
+            count = gc.get_freeze_count()
+            correct_many(["bamk"], self.trie, workers=1)
+
+            self.assertEqual(gc.get_freeze_count(), count)
+        finally:
+            gc.unfreeze()
+
+    def test_check_many(self):
+        """ Test checking texts in workers. """
+
+        texts = ["possible hame", "done", "wrod"]
+
+        self.assertEqual(check_many(texts, self.trie, workers=2),
+                         [self.trie.check_text(text) for text in texts])
+
+    def test_needs_dictionary(self):
+        """ Test that a trie or a path has to be given. """
+
+        with self.assertRaises(ValueError) as _:
+            correct_many(["bamk"])
+
+    def test_spawn_needs_path(self):
+        """ Test that workers that can't fork don't fall back to another dictionary. """
+
+        with mock.patch("multiprocessing.get_all_start_methods", return_value=["spawn"]):
+            with self.assertRaises(ValueError) as _:
+                correct_many(["bamk"], self.trie)
+
+    def test_concurrent_calls(self):
+        """ Test that calls from several threads each use their own trie. """
+
+        other = Trie(["bank 1"])
+        words = ["bamk"] * 4
+        found = {}
+
+        def run(name, trie):
+            found[name] = correct_many(words, trie, workers=1)
+
+        threads = [threading.Thread(target=run, args=(name, trie))
+                   for name, trie in [("tiny", self.trie), ("other", other)]]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(found["tiny"], [self.trie.correct_spelling("bamk")] * 4)
+        self.assertEqual(found["other"], [["bank"]] * 4)
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+
+""" Module for testing class QuerySession. """
+
+import unittest
+from src.trie import Trie
+from src.overlay import TrieView
+
+class TestQuerySession(unittest.TestCase):
+    """ Submodule for unit tests, inherits from unittest.TestCase. """
+
+    @classmethod
+    def setUpClass(cls):
+        """ Build the shared trie once. """
+        cls.trie = Trie.create_from_file()
+
+    def setUp(self):
+        """ Standard setup before every test case is run. """
+        # Arrange
+        self.session = self.trie.query_session(max_distance=2)
+
+    def type(self, text):
+        """ Push every letter of text. """
+
+        for letter in text:
+            self.session.push(letter)
+
+    def test_completions(self):
+        """ Test that completions follow prefix_search while typing and deleting. """
+
+        self.assertEqual(self.session.completions(), [])
+
+        self.type("moo")
+        self.assertEqual(self.session.completions(5), self.trie.prefix_search("moo", 5))
+
+        self.type("nx")
+        self.assertEqual(self.session.completions(), [])
+
+        self.assertEqual(self.session.pop(), "x")
+        self.assertEqual(self.session.text, "moon")
+        self.assertEqual(self.session.completions(5), self.trie.prefix_search("moon", 5))
+
+    def test_corrections(self):
+        """ Test that corrections match correct_spelling for misspelled words. """
+
+        for word in ["bamk", "wrod", "helo", "betwen", "togetherr"]:
+            session = self.trie.query_session(max_distance=2)
+
+            for letter in word:
+                session.push(letter)
+
+            self.assertEqual(session.corrections(10), self.trie.correct_spelling(word, limit=10))
+
+    def test_suggestions(self):
+        """ Test that fuzzy completions rank exact prefixes first. """
+
+        self.type("mpon")
+
+        suggs = self.session.suggestions(5)
+
+        self.assertEqual(len(suggs), 5)
+        self.assertIn(("moon", 1), suggs)
+        self.assertEqual([dist for _, dist in suggs], sorted(dist for _, dist in suggs))
+
+        for _ in range(3):
+            self.session.pop()
+
+        self.type("oo")
+
+        self.assertEqual(self.session.suggestions(3)[0][1], 0)
+
+    def test_trie_change(self):
+        """ Test that the session catches up when words are added or removed. """
+
+        trie = Trie.create_from_file("static/tiny_frequency.txt")
+        session = trie.query_session(max_distance=1)
+
+        for letter in "moonwalc":
+            session.push(letter)
+
+        self.assertEqual(session.corrections(), [])
+
+        trie.add_word("moonwalk", 12)
+        self.assertEqual(session.corrections(), ["moonwalk"])
+
+        trie.remove_word("moonwalk")
+        self.assertEqual(session.corrections(), [])
+
+    def test_view_excludes_removed(self):
+        """ Test that sessions of a view skip its removed words. """
+
+        session = TrieView(self.trie, ["moon"]).query_session(max_distance=1)
+
+        for letter in "mooon":
+            session.push(letter)
+
+        self.assertNotIn("moon", session.corrections())
+        self.assertNotIn("moon", [word for word, _ in session.suggestions()])
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+
+""" Module for testing class DictionaryRegistry. """
+
+import os
+import shutil
+import tempfile
+import unittest
+from src.registry import DictionaryRegistry
+
+class TestRegistry(unittest.TestCase):
+    """ Submodule for unit tests, inherits from unittest.TestCase. """
+
+    def setUp(self):
+        """ Standard setup before every test case is run. """
+        # Arrange
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, "tiny_frequency.txt")
+        shutil.copy("static/tiny_frequency.txt", self.path)
+
+        self.registry = DictionaryRegistry()
+
+    def tearDown(self):
+        """ Clean up after every test case. """
+        shutil.rmtree(self.tmp_dir)
+        self.registry = None
+
+    def test_get_is_cached(self):
+        """ Test that the same trie is returned for repeated lookups. """
+
+        trie = self.registry.get(self.path)
+
+        self.assertIs(self.registry.get(self.path), trie)
+        self.assertEqual(len(self.registry), 1)
+        self.assertTrue(trie.has_word("possible"))
+
+    def test_word_set(self):
+        """ Test that tries get a word set if asked for, counted in their size. """
+
+        registry = DictionaryRegistry(engine="compact", word_set=True)
+        trie = registry.get(self.path)
+
+        self.assertIn("the", trie.word_set)
+        self.assertGreater(registry.total_size(), trie.nbytes)
+
+    def test_reload_when_file_changes(self):
+        """ Test that a changed file is loaded again. """
+
+        trie = self.registry.get(self.path)
+
+        with open(self.path, mode="a", encoding="utf-8") as fd:
+            fd.write("\nmoonwalk 12")
+
+        trie2 = self.registry.get(self.path)
+
+        self.assertIsNot(trie2, trie)
+        self.assertTrue(trie2.has_word("moonwalk"))
+
+    def test_evict_least_recently_used(self):
+        """ Test that old entries are dropped when over the size cap. """
+
+        other = os.path.join(self.tmp_dir, "other.txt")
+        shutil.copy(self.path, other)
+
+        self.registry.max_bytes = 1
+
+        self.registry.get(self.path)
+        self.registry.get(other)
+
+        self.assertEqual(len(self.registry), 1)
+        self.assertIn(other, self.registry)
+        self.assertNotIn(self.path, self.registry)
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+""" Module for testing class PreforkServer. """
+
+import os
+import signal
+import subprocess
+import sys
+import unittest
+import urllib.request
+
+# Serves the pid of the worker answering, preloading sets a value shared by all workers
+SCRIPT = """
+import os, sys
+from server import PreforkServer
+
+shared = {}
+
+def app(environ, start_response):
+    start_response("200 OK", [("Content-Type", "text/plain")])
+    return [f"{os.getpid()} {shared['loaded']}".encode()]
+
+def preload():
+    shared["loaded"] = os.getpid()
+
+server = PreforkServer(app, port=0, workers=2, preload=preload)
+print(server.address[1], flush=True)
+server.run()
+"""
+
+class TestServer(unittest.TestCase):
+    """ Submodule for unit tests, inherits from unittest.TestCase. """
+
+    def setUp(self):
+        """ Standard setup before every test case is run. """
+        # Arrange
+        self.proc = subprocess.Popen([sys.executable, "-c", SCRIPT], stdout=subprocess.PIPE,
+                                     text=True)
+        self.port = int(self.proc.stdout.readline())
+
+    def tearDown(self):
+        """ Clean up after every test case. """
+        self.proc.send_signal(signal.SIGTERM)
+        self.proc.wait(timeout=10)
+        self.proc.stdout.close()
+
+    def get(self):
+        """ Return pid of the answering worker and of the process that preloaded. """
+
+        with urllib.request.urlopen(f"http://127.0.0.1:{self.port}/", timeout=10) as response:
+            return [int(pid) for pid in response.read().split()]
+
+    @unittest.skipUnless(hasattr(os, "fork"), "needs fork")
+    def test_workers_share_preloaded_state(self):
+        """ Test that forked workers answer with what the master preloaded. """
+
+        for _ in range(4):
+            worker, loaded = self.get()
+
+            self.assertEqual(loaded, self.proc.pid)
+            self.assertNotEqual(worker, self.proc.pid)
+
+    @unittest.skipUnless(hasattr(os, "fork"), "needs fork")
+    def test_dead_worker_is_replaced(self):
+        """ Test that the master forks a new worker when one dies. """
+
+        worker, _ = self.get()
+        os.kill(worker, signal.SIGKILL)
+
+        for _ in range(4):
+            self.assertNotEqual(self.get()[0], worker)
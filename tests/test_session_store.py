@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+
+""" Module for testing classes MemoryStore and FileStore. """
+
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from src.session_store import MemoryStore, FileStore
+
+SID = "abcdefghijklmnopqrstuvwxyz012345"
+
+class TestSessionStore(unittest.TestCase):
+    """ Submodule for unit tests, inherits from unittest.TestCase. """
+
+    def setUp(self):
+        """ Standard setup before every test case is run. """
+        # Arrange
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """ Clean up after every test case. """
+        shutil.rmtree(self.tmp_dir)
+
+    def test_set_get_delete(self):
+        """ Test storing, loading and dropping a session in both stores. """
+
+        for store in [MemoryStore(), FileStore(self.tmp_dir)]:
+            data = {"curr_dict": "frequency.txt", "removed_words": {"many", "back"}}
+
+            self.assertIsNone(store.get(SID))
+
+            store.set(SID, data)
+            self.assertEqual(store.get(SID), data)
+
+            store.delete(SID)
+            self.assertIsNone(store.get(SID))
+
+    def test_expiry(self):
+        """ Test that sessions expire after ttl seconds. """
+
+        for store in [MemoryStore(ttl=0.01), FileStore(self.tmp_dir, ttl=0.01)]:
+            store.set(SID, {"message": ""})
+            time.sleep(0.02)
+
+            self.assertIsNone(store.get(SID))
+
+    def test_memory_store_copies(self):
+        """ Test that changing loaded or stored data doesn't change the stored session. """
+
+        store = MemoryStore()
+        data = {"removed_words": {"many"}}
+
+        store.set(SID, data)
+        data["removed_words"].add("back")
+        store.get(SID)["removed_words"].add("back")
+
+        self.assertEqual(store.get(SID), {"removed_words": {"many"}})
+
+    def test_purge(self):
+        """ Test that expired session files are deleted without being asked for. """
+
+        store = FileStore(self.tmp_dir, ttl=0.01)
+        store.set(SID, {"message": ""})
+        time.sleep(0.02)
+
+        store.set("b" * 32, {"message": ""})
+
+        self.assertEqual(os.listdir(self.tmp_dir), ["b" * 32])
+
+    def test_refuses_shared_directory(self):
+        """ Test that a directory others can write to isn't used for sessions. """
+
+        shared = os.path.join(self.tmp_dir, "shared")
+        os.mkdir(shared)
+        os.chmod(shared, 0o777)
+
+        with self.assertRaises(PermissionError) as _:
+            FileStore(shared)
+
+    def test_file_store_json(self):
+        """ Test that sessions are saved as JSON and files that aren't are ignored. """
+
+        store = FileStore(self.tmp_dir)
+        store.set(SID, {"removed_words": {"many", "back"}, "cs_results": ["word"]})
+
+        with open(os.path.join(self.tmp_dir, SID), encoding="utf-8") as fd:
+            self.assertEqual(json.load(fd),
+                             {"removed_words": ["back", "many"], "cs_results": ["word"]})
+
+        with open(os.path.join(self.tmp_dir, "b" * 32), "wb") as fd:
+            fd.write(b"\x80\x04K\x01.")
+
+        self.assertIsNone(store.get("b" * 32))
+
+    def test_malformed_sid(self):
+        """ Test that session ids can't be used to reach other files. """
+
+        store = FileStore(self.tmp_dir)
+
+        self.assertIsNone(store.get("../../etc/passwd"))
+
+        with self.assertRaises(ValueError) as _:
+            store.set("../x", {})
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+
+""" Module for testing class LiveDictionary and Trie.edited. """
+
+import threading
+import unittest
+from src.trie import Trie
+from src.snapshot import LiveDictionary
+
+class TestLiveDictionary(unittest.TestCase):
+    """ Submodule for unit tests, inherits from unittest.TestCase. """
+
+    def setUp(self):
+        """ Standard setup before every test case is run. """
+        # Arrange
+        self.trie = Trie.create_from_file("static/tiny_frequency.txt")
+        self.live = LiveDictionary(self.trie)
+
+    def test_edited_shares_untouched_subtrees(self):
+        """ Test that a new version copies only changed paths and leaves the old one alone. """
+
+        words = self.trie.get_all_words()
+        trie = self.trie.edited(add=[("moonwalk", 12)], remove=["the", "zzz"])
+
+        self.assertEqual(self.trie.get_all_words(), words)
+        self.assertTrue(trie.has_word("moonwalk"))
+        self.assertFalse(trie.contains("the"))
+        self.assertEqual(trie.get_num_words(), len(words))
+        self.assertGreater(trie.cache_key(), self.trie.cache_key())
+
+        # Subtrees without changed words are the same objects
+        self.assertIs(trie.root.children["z"], self.trie.root.children["z"])
+        self.assertIsNot(trie.root.children["m"], self.trie.root.children["m"])
+
+    def test_edited_symspell(self):
+        """ Test that the SymSpell index is edited like the trie, leaving the old index alone. """
+
+        self.trie.enable_symspell(2, 7)
+        trie = self.trie.edited(add=[("moonwalk", 12)], remove=["the"])
+        fresh = Trie()
+        fresh.add_words((word, node.freq) for word, node in
+                        trie._iter_words(trie.root))  # pylint: disable=protected-access
+        fresh.enable_symspell(2, 7)
+
+        self.assertEqual(trie.symspell.freqs, fresh.symspell.freqs)
+        self.assertEqual({edit: sorted(words) for edit, words in trie.symspell.deletes.items()},
+                         {edit: sorted(words) for edit, words in fresh.symspell.deletes.items()})
+        self.assertIn("moonwalk", trie.correct_spelling("moonwalc"))
+        self.assertNotIn("moonwalk", self.trie.correct_spelling("moonwalc"))
+        self.assertNotIn("moonwalk", self.trie.symspell.freqs)
+
+    def test_snapshots_do_not_change(self):
+        """ Test that edits make new versions and old snapshots keep their words. """
+
+        before = self.live.snapshot()
+
+        self.live.add_word("moonwalk", 12)
+        self.live.remove_word("the")
+
+        self.assertFalse(before.contains("moonwalk"))
+        self.assertTrue(before.contains("the"))
+        self.assertTrue(self.live.snapshot().contains("moonwalk"))
+        self.assertFalse(self.live.snapshot().contains("the"))
+
+    def test_concurrent_reads(self):
+        """ Test that readers always see complete versions while a writer edits. """
+
+        errors = []
+        done = threading.Event()
+        size = self.trie.get_num_words()
+
+        def read():
+            while not done.is_set():
+                trie = self.live.snapshot()
+
+                try:
+                    # Words are added and removed in pairs, so every version has the same size
+                    if trie.get_num_words() != size:
+                        errors.append(trie.version)
+
+                    trie.prefix_search("moo")
+                    trie.correct_spelling("mooon", limit=3)
+                except Exception as e:  # pylint: disable=broad-except
+                    errors.append(e)
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+
+        for reader in readers:
+            reader.start()
+
+        for i in range(200):
+            word = f"moon{chr(97 + i % 26)}"
+            previous = "the" if i == 0 else f"moon{chr(97 + (i - 1) % 26)}"
+            self.live.apply(add=[(word, i)], remove=[previous])
+
+        done.set()
+
+        for reader in readers:
+            reader.join()
+
+        self.assertEqual(errors, [])
@@ -5,7 +5,9 @@
 
 import unittest
 from src.trie import Trie
+from src.node import Node
 from src.errors import SearchMiss
+from src.overlay import TrieView
 
 class TestTrie(unittest.TestCase):
     """ Submodule for unit tests, inherits from unittest.TestCase. """
@@ -59,6 +61,77 @@ class TestTrie(unittest.TestCase):
         with self.assertRaises(SearchMiss) as _:
             self.trie.has_word("understand")
 
+    def test_add_words(self):
+        """ Test adding many words at once, sorted or in input order. """
+
+        trie = Trie()
+        trie.add_words([("moon", "5"), ("moonwalk", "12"), ("mood", "7")])
+
+        self.assertEqual(trie.get_all_words(), ["moon", "moonwalk", "mood"])
+        self.assertEqual(trie.prefix_search("moo", 2), [("moonwalk", 12.0), ("mood", 7.0)])
+
+        trie = Trie()
+        trie.add_words([("moon", "5"), ("moonwalk", "12"), ("mood", "7")], sort=True)
+
+        self.assertEqual(trie.get_all_words(), ["mood", "moon", "moonwalk"])
+
+    def test_node_freq(self):
+        """ Test that frequencies are parsed once and leaves share their empty children. """
+
+        node = self.trie._find("moon")
+
+        self.assertIsInstance(node.freq, float)
+        self.assertIs(self.trie._find("xhosa").children, Node.empty)
+
+        with self.assertRaises(AttributeError) as _:
+            node.extra = 1
+
+    def test_num_words_counted(self):
+        """ Test that the word count follows adds, re-adds, removes and edits. """
+
+        self.trie.add_word("moonwalk", 3)
+        self.trie.add_word("moonwalk", 4)
+        self.trie.add_words([("that", 1), ("moonwalks", 1)])
+        self.trie.remove_word("together")
+        edited = self.trie.edited(add=[("that", 2), ("zyx", 1)], remove=["understand", "nope"])
+
+        self.assertEqual(self.trie.get_num_words(), 25403)
+        self.assertEqual(self.trie.get_num_words(), len(self.trie.get_all_words()))
+        self.assertEqual(edited.get_num_words(), len(edited.get_all_words()))
+
+    def test_remove_words(self):
+        """ Test removing many words at once, missing words are skipped. """
+
+        version = self.trie.version
+        removed = self.trie.remove_words(["understand", "moonwalk", "together"])
+
+        self.assertEqual(removed, 2)
+        self.assertEqual(self.trie.get_num_words(), 25400)
+        self.assertEqual(self.trie.version, version + 1)
+
+        with self.assertRaises(SearchMiss) as _:
+            self.trie.has_word("together")
+
+    def test_contains(self):
+        """ Test non-raising membership, with and without the word set. """
+
+        words = ["understand", "moonwalk", "", "und"]
+
+        self.assertEqual(self.trie.contains_many(words), [True, False, False, False])
+
+        self.trie.enable_word_set()
+        self.assertEqual(self.trie.contains_many(words), [True, False, False, False])
+
+        self.trie.add_word("moonwalk", 12)
+        self.trie.remove_word("understand")
+
+        self.assertTrue(self.trie.contains("moonwalk"))
+        self.assertFalse(self.trie.contains("understand"))
+        self.assertFalse(self.trie.contains("moonwalk", exclude={"moonwalk"}))
+
+        with self.assertRaises(SearchMiss) as _:
+            self.trie.has_word("understand")
+
     def test_remove_non_existing_word(self):
         """ Test removing a word not in trie. """
 
@@ -76,6 +149,16 @@ class TestTrie(unittest.TestCase):
         self.assertEqual(wrd_lst[12000], "cervix")
         self.assertEqual(wrd_lst[-1], "xhosa")
 
+    def test_iter_words(self):
+        """ Test lazy alphabetical iteration with seek, offset and limit. """
+
+        self.assertEqual(list(self.trie.iter_words()), sorted(self.trie.get_all_words()))
+        self.assertEqual(list(self.trie.iter_words("moon", limit=3)),
+                         ["moon", "mooncalf", "moonglade"])
+        self.assertEqual(list(self.trie.iter_words("moond", offset=1, limit=2)),
+                         ["mooning", "moonlight"])
+        self.assertEqual(list(self.trie.iter_words("zzz")), [])
+
     def test_prefix_search(self):
         """ Test that prefix search returns expected results. """
 
@@ -92,3 +175,114 @@ class TestTrie(unittest.TestCase):
         """ Test that a prefix search with no matches returns empty list. """
 
         self.assertEqual(self.trie.prefix_search("xyz"), [])
+
+    def test_prefix_search_k(self):
+        """ Test asking for fewer or more results than are cached. """
+
+        self.assertEqual(self.trie.prefix_search("ba", k=3),
+                         [('back', 740270.0), ('battle', 108781.0), ('bank', 66981.4)])
+
+        wrd_lst = self.trie.prefix_search("b", k=100)
+
+        self.assertEqual(len(wrd_lst), 100)
+        self.assertEqual(wrd_lst[:32], self.trie.prefix_search("b", k=32))
+
+        freqs = [item[1] for item in wrd_lst]
+        self.assertEqual(freqs, sorted(freqs, reverse=True))
+
+    def test_prefix_search_after_change(self):
+        """ Test that cached prefix results follow added and removed words. """
+
+        self.trie.prefix_search("ba")
+
+        self.trie.add_word("bazinga", 999999)
+        self.assertEqual(self.trie.prefix_search("ba", k=1), [('bazinga', 999999.0)])
+
+        self.trie.remove_word("bazinga")
+        self.trie.remove_word("back")
+        self.assertEqual(self.trie.prefix_search("ba", k=1), [('battle', 108781.0)])
+
+    def test_suffix_search(self):
+        """ Test that suffix search ranks words ending with suffix by frequency. """
+
+        wrd_lst = self.trie.suffix_search("ing")
+
+        self.assertTrue(all(word.endswith("ing") for word in wrd_lst))
+        self.assertEqual(wrd_lst[:3], self.trie.suffix_search("ing", limit=3))
+        self.assertIn("thing", wrd_lst)
+        self.assertNotIn("things", wrd_lst)
+        self.assertEqual(self.trie.suffix_search("xyzq"), [])
+
+    def test_suffix_search_after_change(self):
+        """ Test that the suffix index follows added and removed words. """
+
+        self.assertEqual(self.trie.suffix_search("walk", limit=1), ["walk"])
+
+        self.trie.add_word("moonwalk", 99999999)
+        self.assertEqual(self.trie.suffix_search("walk", limit=1), ["moonwalk"])
+
+        self.trie.remove_word("moonwalk")
+        self.assertNotIn("moonwalk", self.trie.suffix_search("walk"))
+
+    def test_suffix_search_ties(self):
+        """ Test that tied frequencies are ordered alphabetically however the search runs. """
+
+        trie = Trie(["xba 5", "ayca 5", "zza 5", "ba 9"])
+        view = TrieView(trie, {"missing"})
+
+        self.assertEqual(trie.suffix_search("a"), ["ba", "ayca", "xba", "zza"])
+        self.assertEqual(trie.suffix_search("a", 2), ["ba", "ayca"])
+        self.assertEqual(trie.suffix_search("a", 3), ["ba", "ayca", "xba"])
+        self.assertEqual(view.suffix_search("a", 3), ["ba", "ayca", "xba"])
+
+    def test_correct_spelling(self):
+        """ Test suggestions for substitutions, insertions, deletions and swaps. """
+
+        self.assertEqual(self.trie.correct_spelling("many"), ["many"])
+
+        self.assertEqual(self.trie.correct_spelling("bamk", max_distance=1)[:2],
+                         ["back", "bank"])
+        self.assertEqual(self.trie.correct_spelling("wrod")[0], "word")
+        self.assertIn("hello", self.trie.correct_spelling("helo", max_distance=1))
+        self.assertIn("between", self.trie.correct_spelling("betwen", max_distance=1))
+        self.assertIn("together", self.trie.correct_spelling("togetherr", max_distance=1))
+        self.assertEqual(self.trie.correct_spelling("xqzv"), [])
+
+    def test_correct_spelling_options(self):
+        """ Test transpositions toggle and result limit. """
+
+        self.assertNotIn("word", self.trie.correct_spelling("wrod", max_distance=1,
+                                                            transpositions=False))
+        self.assertEqual(len(self.trie.correct_spelling("helo", limit=3)), 3)
+
+    def test_correct_spelling_best_first(self):
+        """ Test that the top-k search matches ranking every candidate, also after changes. """
+
+        for word in ["bamk", "wrod", "helo", "betwen", "moonwalc"]:
+            for limit in [1, 3, 10]:
+                self.assertEqual(self.trie.correct_spelling(word, limit=limit),
+                                 self.trie.correct_spelling(word, limit=None)[:limit])
+
+        self.trie.add_word("moonwalk", 99999999)
+        self.assertEqual(self.trie.correct_spelling("mownwalk", limit=1), ["moonwalk"])
+        self.assertEqual(self.trie.root.best, 99999999)
+
+        self.trie.remove_word("moonwalk")
+        self.assertNotEqual(self.trie.root.best, 99999999)
+        self.assertNotIn("moonwalk", self.trie.correct_spelling("mownwalk"))
+
+    def test_correct_spelling_symspell(self):
+        """ Test that the symmetric delete index gives the same suggestions. """
+
+        words = ["bamk", "wrod", "helo", "betwen", "xqzv"]
+        ctl_lst = [self.trie.correct_spelling(word) for word in words]
+
+        self.trie.enable_symspell(max_distance=2)
+
+        self.assertEqual([self.trie.correct_spelling(word) for word in words], ctl_lst)
+
+        self.trie.add_word("wrodd", 5)
+        self.assertIn("wrodd", self.trie.correct_spelling("wrod"))
+
+        self.trie.remove_word("word")
+        self.assertNotIn("word", self.trie.correct_spelling("wrod"))